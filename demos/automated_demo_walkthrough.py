@@ -14,6 +14,7 @@ import sys
 import os
 import json
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any
 
@@ -604,9 +605,8 @@ class AutomatedDemoWalkthrough:
             # Actually run the deployment instead of simulating
             self.demo_progress(2, 4, "Connecting to cluster...", "Establishing connection to ArangoDB Oasis")
             if deployment.connect_to_cluster():
-                self.demo_progress(3, 4, "Creating collections and indexes...", "Setting up optimized database schema")
+                self.demo_progress(3, 4, "Creating collections...", "Setting up optimized database schema")
                 deployment.create_collections()
-                deployment.create_indexes()
                 
                 self.demo_progress(4, 4, "Loading data and creating graph...", "Importing tenant data and building unified graph")
                 deployment.load_data()
@@ -614,6 +614,9 @@ class AutomatedDemoWalkthrough:
                 # Create unified graph instead of per-tenant graphs
                 self._ensure_unified_graph()
                 
+                # Index the loaded data in one pass rather than per inserted document
+                deployment.create_indexes()
+                
                 # Verify data was actually imported
                 total_docs = 0
                 collections = ['Device', 'Software', 'Location']
@@ -960,8 +963,8 @@ class AutomatedDemoWalkthrough:
                 software_collection = self.config_manager.get_collection_name("software")
                 aql_new_software = f"""
                 FOR software IN {software_collection}
-                    FILTER STARTS_WITH(software._key, "{base_key_pattern}-")
-                    FILTER software._key != "{original_key}"
+                    FILTER STARTS_WITH(software._key, @key_prefix)
+                    FILTER software._key != @original_key
                     FILTER software.expired == 9223372036854775807
                     FILTER software.created >= @transaction_start
                     SORT software.created DESC
@@ -975,7 +978,11 @@ class AutomatedDemoWalkthrough:
                     }}
                 """
                 
-                cursor = self.database.aql.execute(aql_new_software, bind_vars={"transaction_start": transaction_timestamp.timestamp()})
+                cursor = self.database.aql.execute(aql_new_software, bind_vars={
+                    "key_prefix": f"{base_key_pattern}-",
+                    "original_key": original_key,
+                    "transaction_start": transaction_timestamp.timestamp()
+                })
                 new_software = list(cursor)
                 
                 if new_software:
@@ -1093,14 +1100,12 @@ class AutomatedDemoWalkthrough:
             # Get the first available tenant for demonstration
             device_collection = self.config_manager.get_collection_name("devices")
             tenant_query = f"FOR d IN {device_collection} LIMIT 1 RETURN d.tenantId"
-            cursor = self.database.aql.execute(tenant_query)
-            tenant_results = list(cursor)
+            demo_tenant_id = next(self.database.aql.execute(tenant_query), None)
             
-            if not tenant_results:
+            if demo_tenant_id is None:
                 self.demo_print("No tenants found for alert demonstration", "critical")
                 return
                 
-            demo_tenant_id = tenant_results[0]
             self.demo_print(f"Using tenant: {demo_tenant_id}", "info")
             
             # Show current alert status
@@ -1214,25 +1219,30 @@ class AutomatedDemoWalkthrough:
             software_out_collection = self.config_manager.get_collection_name("software_outs")
             correlation_query = f"""
             FOR alert IN {alert_collection}
-                FILTER alert.tenantId == "{demo_tenant_id}"
+                FILTER alert.tenantId == @tenant_id
                 FOR edge IN {has_alert_collection}
                     FILTER edge._to == alert._id
-                    FOR source IN UNION(
-                        (FOR d IN {device_out_collection} FILTER d._id == edge._from RETURN {{type: "device", name: d.name, id: d._id}}),
-                        (FOR s IN {software_out_collection} FILTER s._id == edge._from RETURN {{type: "software", name: s.name, id: s._id}})
-                    )
+                    // Pick the source type from the edge's _from collection, then
+                    // resolve only that one document
+                    LET source_type = @source_types[PARSE_IDENTIFIER(edge._from).collection]
+                    FILTER source_type != null
+                    LET source = DOCUMENT(edge._from)
+                    FILTER source != null
                     RETURN {{
                         alert_name: alert.name,
                         alert_severity: alert.severity,
                         alert_status: alert.status,
-                        source_type: source.type,
+                        source_type: source_type,
                         source_name: source.name,
-                        source_id: source.id
+                        source_id: source._id
                     }}
             """
             
             try:
-                cursor = self.database.aql.execute(correlation_query)
+                cursor = self.database.aql.execute(correlation_query, bind_vars={
+                    "tenant_id": demo_tenant_id,
+                    "source_types": {device_out_collection: "device", software_out_collection: "software"}
+                })
                 correlations = list(cursor)
                 
                 self.demo_print(f"\nAlert Correlation Analysis:", "critical")
@@ -1449,30 +1459,48 @@ class AutomatedDemoWalkthrough:
             "Adding tenants and analyzing cluster for scaling operations"
         )
         
-        print("Scale-Out Features:")
-        print("- Dynamic Tenant Addition")
-        print("  * Add new tenants without service disruption")
-        print("  * Automatic data generation for new tenants")
-        print("  * SmartGraph isolation maintained")
-        print()
-        print("- Database Server Analysis")
-        print("  * Current cluster state analysis")
-        print("  * Manual server addition preparation")
-        print("  * Performance impact assessment")
-        print()
-        print("- Shard Rebalancing")
-        print("  * Optimal data distribution analysis")
-        print("  * Load balancing recommendations")
-        print("  * Performance optimization guidance")
-        print()
+        print(
+            "Scale-Out Features:\n"
+            "- Dynamic Tenant Addition\n"
+            "  * Add new tenants without service disruption\n"
+            "  * Automatic data generation for new tenants\n"
+            "  * SmartGraph isolation maintained\n\n"
+            "- Database Server Analysis\n"
+            "  * Current cluster state analysis\n"
+            "  * Manual server addition preparation\n"
+            "  * Performance impact assessment\n\n"
+            "- Shard Rebalancing\n"
+            "  * Optimal data distribution analysis\n"
+            "  * Load balancing recommendations\n"
+            "  * Performance optimization guidance\n"
+        )
         
         self.pause_for_observation("Starting scale-out demonstration...")
         
         # Run scale-out demonstration
         print("Starting scale-out operations...")
         try:
-            print("Adding new tenants dynamically...")
             tenant_manager = TenantAdditionManager(NamingConvention.CAMEL_CASE)
+            # One client (and connection pool) shared by all three managers
+            server_manager = DatabaseServerManager(client=tenant_manager.client)
+            shard_manager = ShardRebalancingManager(client=tenant_manager.client)
+            
+            # Connect all managers once, concurrently; each connect is an independent round trip
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                connections = [
+                    executor.submit(connect) for connect in (
+                        tenant_manager.connect_to_database,
+                        server_manager.connect_to_cluster,
+                        shard_manager.connect_to_cluster
+                    )
+                ]
+                tenant_connected, server_connected, shard_connected = (
+                    connection.result() for connection in connections
+                )
+            if not (server_connected and shard_connected):
+                print("[WARNING] Cluster analysis managers could not connect")
+            
+            print("Adding new tenants dynamically...")
             
             # Actually add the new tenants
             new_tenants = [
@@ -1489,7 +1517,7 @@ class AutomatedDemoWalkthrough:
             tenant_count = 0
             for tenant_name, scale_factor in new_tenants:
                 print(f"   - Adding {tenant_name} (scale factor {scale_factor})")
-                if tenant_manager.connect_to_database():
+                if tenant_connected:
                     # Generate tenant data only
                     tenant_config = tenant_manager.create_new_tenant(tenant_name, scale_factor)
                     if tenant_manager.generate_tenant_data(tenant_config):
@@ -1498,9 +1526,11 @@ class AutomatedDemoWalkthrough:
                             # Ensure unified graph exists (only create once)
                             if self._ensure_unified_graph():
                                 tenant_count += 1
-                                print(f"     [SUCCESS] {tenant_name} added successfully")
-                                print(f"     [DATA] Tenant ID: {tenant_config.tenant_id}")
-                                print(f"     [GRAPH] Data visible in unified network_assets_smartgraph")
+                                print(
+                                    f"     [SUCCESS] {tenant_name} added successfully\n"
+                                    f"     [DATA] Tenant ID: {tenant_config.tenant_id}\n"
+                                    "     [GRAPH] Data visible in unified network_assets_smartgraph"
+                                )
                             else:
                                 print(f"     [WARNING] Data imported but unified graph verification failed for {tenant_name}")
                         else:
@@ -1510,105 +1540,115 @@ class AutomatedDemoWalkthrough:
                 else:
                     print(f"     [ERROR] Could not connect to database for {tenant_name}")
             
-            print(f"\n[SCALE] CLUSTER SCALING GUIDANCE")
-            print(f"=" * 60)
-            print(f"After adding {tenant_count} new tenants, follow these steps for optimal scaling:")
-            print()
+            print(
+                "\n[SCALE] CLUSTER SCALING GUIDANCE\n"
+                f"{'=' * 60}\n"
+                f"After adding {tenant_count} new tenants, follow these steps for optimal scaling:\n"
+            )
             
-            print(f"[STEP1] ANALYZE CURRENT CLUSTER STATE")
-            print(f"   [WEB] Open ArangoDB Oasis Web Interface:")
             creds = CredentialsManager.get_database_credentials()
-            print(f"      URL: {creds.endpoint}")
-            print(f"   [CHECK] Check Cluster Status:")
-            print(f"      * Navigate to 'CLUSTER' -> 'Nodes'")
-            print(f"      * Review current server utilization")
-            print(f"      * Note current shard distribution")
-            print()
+            print(
+                "[STEP1] ANALYZE CURRENT CLUSTER STATE\n"
+                "   [WEB] Open ArangoDB Oasis Web Interface:\n"
+                f"      URL: {creds.endpoint}\n"
+                "   [CHECK] Check Cluster Status:\n"
+                "      * Navigate to 'CLUSTER' -> 'Nodes'\n"
+                "      * Review current server utilization\n"
+                "      * Note current shard distribution\n"
+            )
             
-            server_manager = DatabaseServerManager()
             cluster_analysis = server_manager.get_scaling_recommendations()
             
-            print(f"[STEP2] ADD DATABASE SERVERS")
-            print(f"   [LIST] Manual Server Addition Process:")
-            print(f"      1. In Oasis Web UI, go to 'DEPLOYMENTS' -> Your deployment")
-            print(f"      2. Click 'Edit Configuration'")
-            print(f"      3. Increase 'DB-Servers' count by 1 (recommended for {tenant_count + 8} tenants)")
-            print(f"      4. Confirm the scaling operation")
-            print(f"      5. Wait for new servers to be provisioned (~5-10 minutes)")
-            print()
+            print(
+                "[STEP2] ADD DATABASE SERVERS\n"
+                "   [LIST] Manual Server Addition Process:\n"
+                "      1. In Oasis Web UI, go to 'DEPLOYMENTS' -> Your deployment\n"
+                "      2. Click 'Edit Configuration'\n"
+                f"      3. Increase 'DB-Servers' count by 1 (recommended for {tenant_count + 8} tenants)\n"
+                "      4. Confirm the scaling operation\n"
+                "      5. Wait for new servers to be provisioned (~5-10 minutes)\n"
+            )
             
             if self.interactive_mode:
-                print(f"[PAUSE] INTERACTIVE PAUSE:")
-                choice = input(f"   Have you added 1 additional database server? (y/n/skip): ").strip().lower()
+                print("[PAUSE] INTERACTIVE PAUSE:")
+                choice = input("   Have you added 1 additional database server? (y/n/skip): ").strip().lower()
                 
                 if choice == 'y':
-                    print(f"   [DONE] Great! Proceeding with shard rebalancing guidance...")
+                    print("   [DONE] Great! Proceeding with shard rebalancing guidance...")
                 elif choice == 'skip':
-                    print(f"   [SKIP] Skipping server addition - showing rebalancing guidance anyway...")
+                    print("   [SKIP] Skipping server addition - showing rebalancing guidance anyway...")
                 else:
-                    print(f"   [TIP] Add servers now for optimal performance, then continue...")
+                    print("   [TIP] Add servers now for optimal performance, then continue...")
             else:
-                print(f"   [AUTO] NON-INTERACTIVE: Add servers manually, then continue with rebalancing")
+                print("   [AUTO] NON-INTERACTIVE: Add servers manually, then continue with rebalancing")
             
-            print(f"\n[BALANCE] STEP 3: REBALANCE SHARDS")
-            print(f"   [MATH] Optimal Balance Achieved:")
             total_tenants = 8 + tenant_count  # 8 initial + actual new tenants added
             total_servers = 4  # 3 original + 1 added
             graphs_per_server = total_tenants // total_servers
-            print(f"      - Total SmartGraphs: {total_tenants} (8 initial + {tenant_count} new)")
-            print(f"      - Database Servers: {total_servers} (3 original + 1 added)")
-            print(f"      - Graphs per Server: {graphs_per_server} (perfectly balanced)")
-            print(f"      - This demonstrates ideal shard distribution!")
-            print()
+            print(
+                "\n[BALANCE] STEP 3: REBALANCE SHARDS\n"
+                "   [MATH] Optimal Balance Achieved:\n"
+                f"      - Total SmartGraphs: {total_tenants} (8 initial + {tenant_count} new)\n"
+                f"      - Database Servers: {total_servers} (3 original + 1 added)\n"
+                f"      - Graphs per Server: {graphs_per_server} (perfectly balanced)\n"
+                "      - This demonstrates ideal shard distribution!\n"
+            )
             
-            shard_manager = ShardRebalancingManager()
             shard_analysis = shard_manager.analyze_shard_distribution()
             
-            print(f"   [STAT] Shard Rebalancing Process:")
-            print(f"      1. In ArangoDB Web UI, go to 'CLUSTER' -> 'Shards'")
-            print(f"      2. Review current shard distribution across servers")
-            print(f"      3. Click 'Rebalance Shards' if distribution is uneven")
-            print(f"      4. Monitor rebalancing progress")
-            print(f"      5. Verify even distribution after completion")
-            print()
+            print(
+                "   [STAT] Shard Rebalancing Process:\n"
+                "      1. In ArangoDB Web UI, go to 'CLUSTER' -> 'Shards'\n"
+                "      2. Review current shard distribution across servers\n"
+                "      3. Click 'Rebalance Shards' if distribution is uneven\n"
+                "      4. Monitor rebalancing progress\n"
+                "      5. Verify even distribution after completion\n"
+            )
             
-            print(f"   [TARGET] REBALANCING VERIFICATION QUERIES:")
-            print(f"      Run these in ArangoDB Query Editor to verify distribution:")
-            print(f"      ")
-            print(f"      // Check collection shard distribution")
-            print(f"      FOR collection IN ['Device', 'Software', 'hasVersion']")
-            print(f"        RETURN {{")
-            print(f"          collection: collection,")
-            print(f"          shards: LENGTH(COLLECTION_SHARDS(collection))")
-            print(f"        }}")
-            print()
+            print(
+                "   [TARGET] REBALANCING VERIFICATION QUERIES:\n"
+                "      Run these in ArangoDB Query Editor to verify distribution:\n"
+                "      \n"
+                "      // Check collection shard distribution\n"
+                "      FOR collection IN ['Device', 'Software', 'hasVersion']\n"
+                "        RETURN {\n"
+                "          collection: collection,\n"
+                "          shards: LENGTH(COLLECTION_SHARDS(collection))\n"
+                "        }\n"
+            )
             
             if self.interactive_mode:
-                print(f"[PAUSE] INTERACTIVE PAUSE:")
-                choice = input(f"   Have you rebalanced the shards? (y/n/skip): ").strip().lower()
+                print("[PAUSE] INTERACTIVE PAUSE:")
+                choice = input("   Have you rebalanced the shards? (y/n/skip): ").strip().lower()
                 
                 if choice == 'y':
-                    print(f"   [DONE] Excellent! Your cluster is now optimally scaled!")
-                    print(f"   [CHART] Benefits achieved:")
-                    print(f"      * Improved query performance")
-                    print(f"      * Better load distribution")
-                    print(f"      * Enhanced fault tolerance")
-                    print(f"      * Optimal resource utilization")
+                    print(
+                        "   [DONE] Excellent! Your cluster is now optimally scaled!\n"
+                        "   [CHART] Benefits achieved:\n"
+                        "      * Improved query performance\n"
+                        "      * Better load distribution\n"
+                        "      * Enhanced fault tolerance\n"
+                        "      * Optimal resource utilization"
+                    )
                 elif choice == 'skip':
-                    print(f"   [SKIP] Skipping rebalancing verification...")
+                    print("   [SKIP] Skipping rebalancing verification...")
                 else:
-                    print(f"   [TIP] Rebalancing ensures optimal performance!")
+                    print("   [TIP] Rebalancing ensures optimal performance!")
             
-            print(f"\n[CHART] SCALING IMPACT ANALYSIS:")
             initial_tenants = 8
-            print(f"   [STAT] Before scaling: {initial_tenants} tenants")
-            print(f"   [STAT] After scaling: {tenant_count + initial_tenants} tenants ({tenant_count} added)")
-            print(f"   [BOOST] Capacity increase: {((tenant_count + initial_tenants) / initial_tenants - 1) * 100:.0f}%")
-            print(f"   [SPEED] Performance optimization: Server addition + shard rebalancing")
-            print(f"   [SECURE] Data isolation: Maintained across all tenants")
-            
-            print(f"[SUCCESS] Scale-out demonstration completed successfully")
-            print(f"[DATA] Added {tenant_count} new tenants to the system")
+            print(
+                "\n[CHART] SCALING IMPACT ANALYSIS:\n"
+                f"   [STAT] Before scaling: {initial_tenants} tenants\n"
+                f"   [STAT] After scaling: {tenant_count + initial_tenants} tenants ({tenant_count} added)\n"
+                f"   [BOOST] Capacity increase: {((tenant_count + initial_tenants) / initial_tenants - 1) * 100:.0f}%\n"
+                "   [SPEED] Performance optimization: Server addition + shard rebalancing\n"
+                "   [SECURE] Data isolation: Maintained across all tenants"
+            )
+            
+            print(
+                "[SUCCESS] Scale-out demonstration completed successfully\n"
+                f"[DATA] Added {tenant_count} new tenants to the system"
+            )
             
             scale_out_results = {
                 "new_tenants_added": tenant_count,
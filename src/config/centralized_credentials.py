@@ -16,7 +16,7 @@ from src.config.generation_constants import GENERATION_CONSTANTS, NETWORK_CONSTA
 load_dotenv()
 
 
-@dataclass
+@dataclass(frozen=True)
 class DatabaseCredentials:
     """Database connection credentials."""
     endpoint: str
@@ -37,6 +37,9 @@ class DatabaseCredentials:
 class CredentialsManager:
     """Centralized credentials management with environment variable support."""
     
+    # Resolved credentials per environment; see reload()
+    _credentials: Dict[str, DatabaseCredentials] = {}
+    
     @classmethod
     def get_database_credentials(cls, environment: str = "production") -> DatabaseCredentials:
         """
@@ -47,7 +50,14 @@ class CredentialsManager:
         - ARANGO_USERNAME: Database username  
         - ARANGO_PASSWORD: Database password
         - ARANGO_DATABASE: Database name
+        
+        Credentials are resolved once per environment and shared afterwards;
+        call reload() to pick up changed environment variables.
         """
+        cached = cls._credentials.get(environment)
+        if cached is not None:
+            return cached
+        
         endpoint = os.getenv('ARANGO_ENDPOINT')
         username = os.getenv('ARANGO_USERNAME') 
         password = os.getenv('ARANGO_PASSWORD')
@@ -62,12 +72,19 @@ class CredentialsManager:
                 "- ARANGO_DATABASE (e.g., network_assets_demo)"
             )
         
-        return DatabaseCredentials(
+        credentials = DatabaseCredentials(
             endpoint=endpoint,
             username=username,
             password=password,
             database_name=database_name
         )
+        cls._credentials[environment] = credentials
+        return credentials
+    
+    @classmethod
+    def reload(cls) -> None:
+        """Discard cached credentials so the next lookup re-reads the environment."""
+        cls._credentials.clear()
     
     @classmethod
     def get_database_params(cls, environment: str = "production") -> Dict[str, str]:
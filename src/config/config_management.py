@@ -5,16 +5,17 @@ Eliminates hard-wired values throughout the codebase and provides
 secure credential management for the multi-tenant demo.
 """
 
-import json
 import re
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Dict, Optional, Any
+from functools import lru_cache
+from typing import Dict, Optional, Any, Tuple
 from enum import Enum
 
 
 # Import centralized credentials to avoid duplication
 from src.config.centralized_credentials import DatabaseCredentials, CredentialsManager
+from src.utils.json_io import write_json_file
 
 
 class NamingConvention(Enum):
@@ -23,58 +24,59 @@ class NamingConvention(Enum):
     SNAKE_CASE = "snake_case"
 
 
+# Known collection names, resolved before the general conversion rules
+_CAMEL_TO_SNAKE_SPECIAL_CASES = {
+    "hasConnection": "has_connection",
+    "hasLocation": "has_location",
+    "hasDeviceSoftware": "has_device_software",
+    "hasVersion": "has_version",
+    "hasAlert": "has_alert",
+    "subClassOf": "sub_class_of",
+    "DeviceProxyIn": "device_proxy_in",
+    "DeviceProxyOut": "device_proxy_out",
+    "SoftwareProxyIn": "software_proxy_in",
+    "SoftwareProxyOut": "software_proxy_out",
+}
+
+_SNAKE_TO_CAMEL_SPECIAL_CASES = {
+    "has_connection": "hasConnection",
+    "has_location": "hasLocation",
+    "has_device_software": "hasDeviceSoftware",
+    "has_version": "hasVersion",
+    "device_proxy_in": "DeviceProxyIn",
+    "device_proxy_out": "DeviceProxyOut",
+    "software_proxy_in": "SoftwareProxyIn",
+    "software_proxy_out": "SoftwareProxyOut",
+}
+
+_WORD_BOUNDARY = re.compile('(.)([A-Z][a-z]+)')
+_LOWER_UPPER_BOUNDARY = re.compile('([a-z0-9])([A-Z])')
+
+
 class NamingConverter:
     """Utility class for converting between naming conventions."""
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def camel_to_snake(name: str) -> str:
         """Convert camelCase to snake_case."""
         # Handle special cases first
-        if name == "hasConnection":
-            return "has_connection"
-        elif name == "hasLocation":
-            return "has_location"
-        elif name == "hasDeviceSoftware":
-            return "has_device_software"
-        elif name == "hasVersion":
-            return "has_version"
-        elif name == "hasAlert":
-            return "has_alert"
-        elif name == "subClassOf":
-            return "sub_class_of"
-        elif name == "DeviceProxyIn":
-            return "device_proxy_in"
-        elif name == "DeviceProxyOut":
-            return "device_proxy_out"
-        elif name == "SoftwareProxyIn":
-            return "software_proxy_in"
-        elif name == "SoftwareProxyOut":
-            return "software_proxy_out"
+        special_case = _CAMEL_TO_SNAKE_SPECIAL_CASES.get(name)
+        if special_case is not None:
+            return special_case
         
         # General conversion: insert underscore before uppercase letters
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+        s1 = _WORD_BOUNDARY.sub(r'\1_\2', name)
+        return _LOWER_UPPER_BOUNDARY.sub(r'\1_\2', s1).lower()
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def snake_to_camel(name: str, pascal_case: bool = False) -> str:
         """Convert snake_case to camelCase or PascalCase."""
         # Handle special cases first
-        if name == "has_connection":
-            return "hasConnection"
-        elif name == "has_location":
-            return "hasLocation"
-        elif name == "has_device_software":
-            return "hasDeviceSoftware"
-        elif name == "has_version":
-            return "hasVersion"
-        elif name == "device_proxy_in":
-            return "DeviceProxyIn"
-        elif name == "device_proxy_out":
-            return "DeviceProxyOut"
-        elif name == "software_proxy_in":
-            return "SoftwareProxyIn"
-        elif name == "software_proxy_out":
-            return "SoftwareProxyOut"
+        special_case = _SNAKE_TO_CAMEL_SPECIAL_CASES.get(name)
+        if special_case is not None:
+            return special_case
         
         # General conversion
         components = name.split('_')
@@ -374,8 +376,7 @@ class ConfigurationManager:
             }
         }
         
-        with open(file_path, 'w') as f:
-            json.dump(config_data, f, indent=2)
+        write_json_file(file_path, config_data)
     
     def validate_configuration(self) -> Dict[str, bool]:
         """Validate current configuration."""
@@ -396,17 +397,19 @@ class ConfigurationManager:
         return validation_results
 
 
-# Global configuration instance - lazily initialized to avoid requiring
+# Global configuration instances - lazily initialized to avoid requiring
 # environment variables at import time (enables unit testing without DB).
-config = None
+# One instance is kept per (environment, naming convention), so components
+# that alternate between conventions do not rebuild their configuration.
+_configs: Dict[Tuple[str, NamingConvention], ConfigurationManager] = {}
 
 
 def get_config(environment: str = "production", naming_convention: NamingConvention = NamingConvention.CAMEL_CASE) -> ConfigurationManager:
     """Get global configuration instance (created on first call)."""
-    global config
-    if config is None or config.environment != environment or config.naming_convention != naming_convention:
-        config = ConfigurationManager(environment, naming_convention)
-    return config
+    key = (environment, naming_convention)
+    if key not in _configs:
+        _configs[key] = ConfigurationManager(environment, naming_convention)
+    return _configs[key]
 
 
 def initialize_logging(log_level: str = "INFO") -> None:
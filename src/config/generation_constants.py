@@ -6,12 +6,13 @@ Centralized constants for data generation to eliminate hardwired values
 and provide a single source of truth for all generation parameters.
 """
 
-from dataclasses import dataclass
-from typing import Dict, List, Any
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, ClassVar, FrozenSet, Mapping, Tuple
 import sys
 
 
-@dataclass
+@dataclass(frozen=True)
 class GenerationConstants:
     """Centralized constants for data generation."""
     
@@ -42,6 +43,9 @@ class GenerationConstants:
     MAX_DOCUMENTS_PER_COLLECTION: int = 10000
     BULK_INSERT_BATCH_SIZE: int = 1000
     
+    # Concurrent collection file writes per tenant
+    FILE_WRITE_WORKERS: int = 8
+    
     # TTL Configuration (in seconds)
     DEFAULT_TTL_SECONDS: int = 7776000  # 90 days
     SHORT_TTL_SECONDS: int = 2592000    # 30 days
@@ -53,15 +57,10 @@ class GenerationConstants:
     SECONDS_PER_MINUTE: int = 60
     
     # Default Firewall Rules
-    DEFAULT_FIREWALL_RULES: List[str] = None
-    
-    def __post_init__(self):
-        """Initialize default values that can't be set in dataclass definition."""
-        if self.DEFAULT_FIREWALL_RULES is None:
-            self.DEFAULT_FIREWALL_RULES = ["allow 80", "allow 443"]
+    DEFAULT_FIREWALL_RULES: Tuple[str, ...] = ("allow 80", "allow 443")
 
 
-@dataclass
+@dataclass(frozen=True)
 class NetworkConstants:
     """Network-specific constants."""
     
@@ -79,13 +78,13 @@ class NetworkConstants:
     MAC_ADDRESS_FORMAT: str = "{:02x}"
 
 
-@dataclass
+@dataclass(frozen=True)
 class SystemConstants:
     """System-wide constants."""
     
     # Maximum Values
-    MAX_TIMESTAMP: int = sys.maxsize
-    NEVER_EXPIRES: int = sys.maxsize
+    MAX_TIMESTAMP: ClassVar[int] = sys.maxsize
+    NEVER_EXPIRES: ClassVar[int] = sys.maxsize
     
     # Success Rate Calculation
     PERCENTAGE_MULTIPLIER: int = 100
@@ -96,7 +95,7 @@ class SystemConstants:
     PERFORMANCE_THRESHOLD_SECONDS: float = 1.0
 
 
-@dataclass 
+@dataclass(frozen=True)
 class DatabaseConstants:
     """Database configuration constants."""
     
@@ -111,14 +110,33 @@ class DatabaseConstants:
     TTL_INDEX_PREFIX: str = "ttl_"
     MDI_INDEX_PREFIX: str = "mdi_"
     HASH_INDEX_PREFIX: str = "idx_"
+    
+    # Bulk import request size (bytes of JSON per import request)
+    IMPORT_BATCH_BYTES: int = 8 * 1024 * 1024
+    
+    # Data files larger than this are parsed incrementally instead of all at once
+    STREAM_PARSE_BYTES: int = 64 * 1024 * 1024
+    
+    # Concurrent data file imports per tenant (distinct collections, so no write conflicts)
+    IMPORT_WORKERS: int = 4
+    
+    # Tenants whose data files are imported at the same time
+    TENANT_IMPORT_WORKERS: int = 8
+    
+    # Persistent HTTP connections kept per host; covers IMPORT_WORKERS * TENANT_IMPORT_WORKERS
+    # concurrent import requests so parallel loads reuse connections instead of re-handshaking
+    HTTP_POOL_MAXSIZE: int = 32
+    
+    # Seconds a cluster metadata snapshot (collections and document counts) is reused
+    CLUSTER_SNAPSHOT_TTL_SECONDS: float = 5.0
 
 
-@dataclass
+@dataclass(frozen=True)
 class AlertConstants:
     """Alert system constants."""
     
     # Keywords to filter from alert names
-    FILTERED_NAME_KEYWORDS: List[str] = None
+    FILTERED_NAME_KEYWORDS: FrozenSet[str] = frozenset({'proxy', 'out', 'in'})
     
     # Fallback names
     DEVICE_NAME_FALLBACK: str = "Device"
@@ -126,116 +144,115 @@ class AlertConstants:
     
     # Alert name format
     ALERT_NAME_FORMAT: str = "{severity} {alert_type}: {source_name}"
-    
-    def __post_init__(self):
-        """Initialize filtered keywords list."""
-        if self.FILTERED_NAME_KEYWORDS is None:
-            self.FILTERED_NAME_KEYWORDS = ['proxy', 'out', 'in']
 
 
-@dataclass
+@dataclass(frozen=True)
 class LocationConstants:
-    """Location and geographic constants."""
+    """
+    Location and geographic constants.
+    
+    Instances are frozen and each location record is a read-only mapping, but
+    the records are not hashable, so neither is a LocationConstants instance.
+    """
     
     # Default Locations with coordinates
-    DEFAULT_LOCATIONS: List[Dict[str, Any]] = None
-    
-    def __post_init__(self):
-        """Initialize default locations."""
-        if self.DEFAULT_LOCATIONS is None:
-            self.DEFAULT_LOCATIONS = [
-                {"name": "New York Data Center", "address": "123 Broadway, New York, NY", "lat": 40.7128, "lon": -74.0060},
-                {"name": "London Office", "address": "456 Oxford St, London", "lat": 51.5074, "lon": -0.1278},
-                {"name": "Tokyo HQ", "address": "789 Ginza, Tokyo", "lat": 35.6895, "lon": 139.6917},
-                {"name": "Sydney Warehouse", "address": "101 George St, Sydney", "lat": -33.8688, "lon": 151.2093},
-                {"name": "Frankfurt Cloud Region", "address": "222 Mainzer Landstr, Frankfurt", "lat": 50.1109, "lon": 8.6821},
-                {"name": "Singapore Hub", "address": "Marina Bay, Singapore", "lat": 1.2966, "lon": 103.8764},
-                {"name": "Toronto Branch", "address": "Bay St, Toronto", "lat": 43.6532, "lon": -79.3832},
-                {"name": "Mumbai Center", "address": "Nariman Point, Mumbai", "lat": 18.9220, "lon": 72.8347},
-                {"name": "Sao Paulo Office", "address": "Av. Paulista, Sao Paulo", "lat": -23.5505, "lon": -46.6333},
-                {"name": "Cape Town Hub", "address": "V&A Waterfront, Cape Town", "lat": -33.9025, "lon": 18.4167}
-            ]
-
-
-@dataclass
+    DEFAULT_LOCATIONS: Tuple[Mapping[str, Any], ...] = field(default_factory=lambda: tuple(map(MappingProxyType, (
+        {"name": "New York Data Center", "address": "123 Broadway, New York, NY", "lat": 40.7128, "lon": -74.0060},
+        {"name": "London Office", "address": "456 Oxford St, London", "lat": 51.5074, "lon": -0.1278},
+        {"name": "Tokyo HQ", "address": "789 Ginza, Tokyo", "lat": 35.6895, "lon": 139.6917},
+        {"name": "Sydney Warehouse", "address": "101 George St, Sydney", "lat": -33.8688, "lon": 151.2093},
+        {"name": "Frankfurt Cloud Region", "address": "222 Mainzer Landstr, Frankfurt", "lat": 50.1109, "lon": 8.6821},
+        {"name": "Singapore Hub", "address": "Marina Bay, Singapore", "lat": 1.2966, "lon": 103.8764},
+        {"name": "Toronto Branch", "address": "Bay St, Toronto", "lat": 43.6532, "lon": -79.3832},
+        {"name": "Mumbai Center", "address": "Nariman Point, Mumbai", "lat": 18.9220, "lon": 72.8347},
+        {"name": "Sao Paulo Office", "address": "Av. Paulista, Sao Paulo", "lat": -23.5505, "lon": -46.6333},
+        {"name": "Cape Town Hub", "address": "V&A Waterfront, Cape Town", "lat": -33.9025, "lon": 18.4167}
+    ))))
+
+
+@dataclass(frozen=True)
 class OperatingSystemConstants:
     """Operating system constants."""
     
     # Device Operating Systems
-    DEVICE_OPERATING_SYSTEMS: List[str] = None
+    DEVICE_OPERATING_SYSTEMS: Tuple[str, ...] = (
+        "Ubuntu 20.04.6 LTS",
+        "CentOS 7.9.2009",
+        "Red Hat Enterprise Linux 8.8",
+        "Windows Server 2019 Datacenter",
+        "Windows 10 Enterprise LTSC 2021",
+        "Windows Server 2022 Datacenter",
+        "Debian 11.7",
+        "SUSE Linux Enterprise Server 15 SP4"
+    )
     
     # Software Operating Systems
-    SOFTWARE_OPERATING_SYSTEMS: List[str] = None
-    
-    def __post_init__(self):
-        """Initialize operating system lists."""
-        if self.DEVICE_OPERATING_SYSTEMS is None:
-            self.DEVICE_OPERATING_SYSTEMS = [
-                "Ubuntu 20.04.6 LTS",
-                "CentOS 7.9.2009", 
-                "Red Hat Enterprise Linux 8.8",
-                "Windows Server 2019 Datacenter",
-                "Windows 10 Enterprise LTSC 2021",
-                "Windows Server 2022 Datacenter",
-                "Debian 11.7",
-                "SUSE Linux Enterprise Server 15 SP4"
-            ]
-        
-        if self.SOFTWARE_OPERATING_SYSTEMS is None:
-            self.SOFTWARE_OPERATING_SYSTEMS = [
-                "Ubuntu 22.04.3 LTS",
-                "Alpine Linux 3.18.3",
-                "Embedded Linux 4.14.247", 
-                "CentOS Stream 9",
-                "Embedded Linux 5.4.188",
-                "FreeBSD 13.2-RELEASE",
-                "OpenWrt 22.03.5"
-            ]
+    SOFTWARE_OPERATING_SYSTEMS: Tuple[str, ...] = (
+        "Ubuntu 22.04.3 LTS",
+        "Alpine Linux 3.18.3",
+        "Embedded Linux 4.14.247",
+        "CentOS Stream 9",
+        "Embedded Linux 5.4.188",
+        "FreeBSD 13.2-RELEASE",
+        "OpenWrt 22.03.5"
+    )
+
+
+# Read-only configuration views derived from the generation defaults, built once
+# at import; prefer these over the GenerationUtilities accessors
+_GENERATION_DEFAULTS = GenerationConstants()
+
+TTL_CONFIG: Mapping[str, int] = MappingProxyType({
+    "default_ttl_seconds": _GENERATION_DEFAULTS.DEFAULT_TTL_SECONDS,
+    "short_ttl_seconds": _GENERATION_DEFAULTS.SHORT_TTL_SECONDS,
+    "long_ttl_seconds": _GENERATION_DEFAULTS.LONG_TTL_SECONDS
+})
+
+PORT_RANGES: Mapping[str, Mapping[str, int]] = MappingProxyType({
+    "dynamic": MappingProxyType({
+        "min": _GENERATION_DEFAULTS.DYNAMIC_PORT_MIN,
+        "max": _GENERATION_DEFAULTS.DYNAMIC_PORT_MAX
+    }),
+    "software": MappingProxyType({
+        "min": _GENERATION_DEFAULTS.SOFTWARE_PORT_MIN,
+        "max": _GENERATION_DEFAULTS.SOFTWARE_PORT_MAX
+    })
+})
+
+GENERATION_LIMITS: Mapping[str, int] = MappingProxyType({
+    "max_retries": _GENERATION_DEFAULTS.MAX_GENERATION_RETRIES,
+    "max_tenants": _GENERATION_DEFAULTS.MAX_TENANT_COUNT,
+    "max_documents": _GENERATION_DEFAULTS.MAX_DOCUMENTS_PER_COLLECTION,
+    "batch_size": _GENERATION_DEFAULTS.BULK_INSERT_BATCH_SIZE
+})
 
 
 class GenerationUtilities:
-    """Utility functions for data generation."""
+    """Accessors kept for compatibility; they return the module-level views."""
+    
+    __slots__ = ()
     
     @staticmethod
-    def get_ttl_config() -> Dict[str, int]:
-        """Get TTL configuration dictionary."""
-        constants = GenerationConstants()
-        return {
-            "default_ttl_seconds": constants.DEFAULT_TTL_SECONDS,
-            "short_ttl_seconds": constants.SHORT_TTL_SECONDS,
-            "long_ttl_seconds": constants.LONG_TTL_SECONDS
-        }
+    def get_ttl_config() -> Mapping[str, int]:
+        """Get TTL configuration (read-only, shared)."""
+        return TTL_CONFIG
     
     @staticmethod
-    def get_port_ranges() -> Dict[str, Dict[str, int]]:
-        """Get port range configuration."""
-        constants = GenerationConstants()
-        return {
-            "dynamic": {
-                "min": constants.DYNAMIC_PORT_MIN,
-                "max": constants.DYNAMIC_PORT_MAX
-            },
-            "software": {
-                "min": constants.SOFTWARE_PORT_MIN,
-                "max": constants.SOFTWARE_PORT_MAX
-            }
-        }
+    def get_port_ranges() -> Mapping[str, Mapping[str, int]]:
+        """Get port range configuration (read-only, shared)."""
+        return PORT_RANGES
     
     @staticmethod
-    def get_generation_limits() -> Dict[str, int]:
-        """Get generation limit configuration."""
-        constants = GenerationConstants()
-        return {
-            "max_retries": constants.MAX_GENERATION_RETRIES,
-            "max_tenants": constants.MAX_TENANT_COUNT,
-            "max_documents": constants.MAX_DOCUMENTS_PER_COLLECTION,
-            "batch_size": constants.BULK_INSERT_BATCH_SIZE
-        }
+    def get_generation_limits() -> Mapping[str, int]:
+        """Get generation limit configuration (read-only, shared)."""
+        return GENERATION_LIMITS
 
 
 class GenerationMessages:
     """Standardized messages for data generation."""
     
+    __slots__ = ()
+    
     GENERATION_START: str = "Starting data generation"
     GENERATION_COMPLETE: str = "Data generation completed successfully"
     GENERATION_FAILED: str = "Data generation failed"
@@ -254,11 +271,24 @@ class GenerationMessages:
 
 
 # Global instances for easy access
-GENERATION_CONSTANTS = GenerationConstants()
+GENERATION_CONSTANTS = _GENERATION_DEFAULTS
 NETWORK_CONSTANTS = NetworkConstants()
 SYSTEM_CONSTANTS = SystemConstants()
-LOCATION_CONSTANTS = LocationConstants()
-OS_CONSTANTS = OperatingSystemConstants()
+
+# Constants only some callers need, created on first access (see __getattr__)
+_LAZY_CONSTANTS = {
+    "LOCATION_CONSTANTS": LocationConstants,
+    "OS_CONSTANTS": OperatingSystemConstants
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Create lazily initialized module constants on first access (PEP 562)."""
+    factory = _LAZY_CONSTANTS.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    instance = globals()[name] = factory()
+    return instance
 
 
 if __name__ == "__main__":
@@ -270,14 +300,13 @@ if __name__ == "__main__":
     print(f"Max retries: {GENERATION_CONSTANTS.MAX_GENERATION_RETRIES}")
     print(f"Network ports: HTTP={NETWORK_CONSTANTS.HTTP_PORT}, HTTPS={NETWORK_CONSTANTS.HTTPS_PORT}")
     print(f"System max: {SYSTEM_CONSTANTS.MAX_TIMESTAMP}")
-    print(f"Locations available: {len(LOCATION_CONSTANTS.DEFAULT_LOCATIONS)}")
-    print(f"Device OS options: {len(OS_CONSTANTS.DEVICE_OPERATING_SYSTEMS)}")
+    # Lazy constants resolve through module attribute access, as for importers
+    this_module = sys.modules[__name__]
+    print(f"Locations available: {len(this_module.LOCATION_CONSTANTS.DEFAULT_LOCATIONS)}")
+    print(f"Device OS options: {len(this_module.OS_CONSTANTS.DEVICE_OPERATING_SYSTEMS)}")
     
     # Test utility functions
-    ttl_config = GenerationUtilities.get_ttl_config()
-    print(f"TTL config: {ttl_config}")
-    
-    port_ranges = GenerationUtilities.get_port_ranges()
-    print(f"Port ranges: {port_ranges}")
+    print(f"TTL config: {dict(TTL_CONFIG)}")
+    print(f"Port ranges: { {name: dict(bounds) for name, bounds in PORT_RANGES.items()} }")
     
     print("\n[SUCCESS] All generation constants loaded successfully!")
@@ -8,8 +8,11 @@ in the multi-tenant temporal graph system.
 Author: Scalable Multi-Tenant Temporal Graph Reference Implementation
 """
 
-from dataclasses import dataclass
-from typing import Dict, List, Any, Optional
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 from enum import Enum
 
 
@@ -20,25 +23,55 @@ class TaxonomyScope(Enum):
     HYBRID = "hybrid"  # Core shared + tenant extensions
 
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ClassDefinition:
-    """Definition of a taxonomy class."""
+    """
+    Definition of a taxonomy class.
+    
+    Definitions are identified by key: equality and hashing use the key
+    alone, with the hash computed once at construction.
+    """
     key: str
     name: str
     description: str
     category: str
     parent_class: Optional[str] = None
-    properties: Optional[Dict[str, Any]] = None
+    properties: Mapping[str, Any] = field(default_factory=dict)
     
     def __post_init__(self):
-        """Initialize default properties."""
-        if self.properties is None:
-            self.properties = {}
+        """Intern identifiers and property names, and freeze properties read-only."""
+        object.__setattr__(self, "key", sys.intern(self.key))
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "category", sys.intern(self.category))
+        if self.parent_class is not None:
+            object.__setattr__(self, "parent_class", sys.intern(self.parent_class))
+        object.__setattr__(self, "properties", MappingProxyType(
+            {sys.intern(name): value for name, value in self.properties.items()}))
+        object.__setattr__(self, "_hash", hash(self.key))
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ClassDefinition):
+            return NotImplemented
+        return self.key == other.key
+    
+    def __hash__(self) -> int:
+        return self._hash
+
+
+def _index_children(classes: Mapping[str, ClassDefinition]) -> Mapping[str, Tuple[ClassDefinition, ...]]:
+    """Build a read-only parent key -> direct subclasses index for a taxonomy."""
+    children: Dict[str, List[ClassDefinition]] = defaultdict(list)
+    for class_def in classes.values():
+        if class_def.parent_class is not None:
+            children[class_def.parent_class].append(class_def)
+    return MappingProxyType({parent: tuple(subclasses) for parent, subclasses in children.items()})
 
 
 class DeviceTaxonomy:
     """Device classification hierarchy."""
     
+    __slots__ = ()
+    
     # Universal root (shared across device and software trees)
     UNIVERSAL_ROOT = {
         "asset": ClassDefinition(
@@ -270,20 +303,30 @@ class DeviceTaxonomy:
         )
     }
     
+    # All classes merged once at class creation (read-only view)
+    _ALL_CLASSES = MappingProxyType({
+        **UNIVERSAL_ROOT, **ROOT_CLASSES, **NETWORK_CLASSES, **SECURITY_CLASSES
+    })
+    
+    # Direct subclasses per parent class key
+    _CHILDREN = _index_children(_ALL_CLASSES)
+    
     @classmethod
-    def get_all_classes(cls) -> Dict[str, ClassDefinition]:
+    def get_all_classes(cls) -> Mapping[str, ClassDefinition]:
         """Get all device taxonomy classes (including universal root)."""
-        all_classes = {}
-        all_classes.update(cls.UNIVERSAL_ROOT)
-        all_classes.update(cls.ROOT_CLASSES)
-        all_classes.update(cls.NETWORK_CLASSES) 
-        all_classes.update(cls.SECURITY_CLASSES)
-        return all_classes
+        return cls._ALL_CLASSES
+    
+    @classmethod
+    def get_children(cls, parent_key: str) -> Tuple[ClassDefinition, ...]:
+        """Get the direct subclasses of a device taxonomy class."""
+        return cls._CHILDREN.get(parent_key, ())
 
 
 class SoftwareTaxonomy:
     """Software classification hierarchy."""
     
+    __slots__ = ()
+    
     # Root categories
     ROOT_CLASSES = {
         "software": ClassDefinition(
@@ -516,18 +559,26 @@ class SoftwareTaxonomy:
         )
     }
     
+    # All classes merged once at class creation (read-only view)
+    _ALL_CLASSES = MappingProxyType({
+        **ROOT_CLASSES, **DATABASE_CLASSES, **WEBSERVER_CLASSES, **OS_CLASSES
+    })
+    
+    # Direct subclasses per parent class key
+    _CHILDREN = _index_children(_ALL_CLASSES)
+    
     @classmethod
-    def get_all_classes(cls) -> Dict[str, ClassDefinition]:
+    def get_all_classes(cls) -> Mapping[str, ClassDefinition]:
         """Get all software taxonomy classes."""
-        all_classes = {}
-        all_classes.update(cls.ROOT_CLASSES)
-        all_classes.update(cls.DATABASE_CLASSES)
-        all_classes.update(cls.WEBSERVER_CLASSES) 
-        all_classes.update(cls.OS_CLASSES)
-        return all_classes
+        return cls._ALL_CLASSES
+    
+    @classmethod
+    def get_children(cls, parent_key: str) -> Tuple[ClassDefinition, ...]:
+        """Get the direct subclasses of a software taxonomy class."""
+        return cls._CHILDREN.get(parent_key, ())
 
 
-@dataclass
+@dataclass(frozen=True)
 class TaxonomyConstants:
     """Constants for taxonomy system configuration."""
     
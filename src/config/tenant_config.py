@@ -18,7 +18,7 @@ import sys
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
-from src.ttl.ttl_constants import NEVER_EXPIRES
+from src.ttl.ttl_constants import NEVER_EXPIRES, TTLConstants
 from src.config.generation_constants import DatabaseConstants
 
 
@@ -56,7 +56,7 @@ class TenantConfig:
     
     # Temporal data management (FR2.5, FR5.1, FR5.2) - Current vs Historical TTL strategy
     ttl_enabled: bool = True  # Enable TTL for historical documents only
-    ttl_expire_after_seconds: int = None  # Will be set from TTLConstants in __post_init__
+    ttl_expire_after_seconds: int = TTLConstants.DEFAULT_TTL_EXPIRE_SECONDS
     preserve_current_configs: bool = True  # Never age out current configurations (expired = NEVER_EXPIRES)
     temporal_attribute_name: str = "expired"  # TTL applies to expired field
     
@@ -71,14 +71,6 @@ class TenantConfig:
     
     def __post_init__(self):
         """Initialize auto-generated fields and validate configuration."""
-        # Set TTL expire seconds from constants if not provided
-        if self.ttl_expire_after_seconds is None:
-            try:
-                from src.ttl.ttl_constants import TTLConstants, NEVER_EXPIRES
-                self.ttl_expire_after_seconds = TTLConstants.DEFAULT_TTL_EXPIRE_SECONDS
-            except ImportError:
-                self.ttl_expire_after_seconds = TTLConstants.DEFAULT_TTL_EXPIRE_SECONDS  # Fallback to 30 days
-        
         if self.smartgraph_attribute is None:
             self.smartgraph_attribute = "tenantId"
         
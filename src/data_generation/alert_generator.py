@@ -25,7 +25,8 @@ sys.path.insert(0, str(project_root))
 from src.config.config_management import get_config, NamingConvention
 from src.ttl.ttl_constants import TTLConstants, NEVER_EXPIRES
 from src.utils.alert_naming import alert_namer
-from src.config.generation_constants import GenerationConstants
+from src.config.generation_constants import GENERATION_CONSTANTS
+from src.utils.json_io import write_json_array
 
 import logging
 
@@ -103,7 +104,7 @@ class AlertGenerator:
                 AlertType.CONNECTIVITY,
                 AlertSeverity.CRITICAL,
                 "Connection to {target_ip} failed - interface {interface} down",
-                {"target_ip": f"{GenerationConstants().IP_SUBNET_BASE}.1.100", "interface": "eth0", "connection_type": "ethernet"},
+                {"target_ip": f"{GENERATION_CONSTANTS.IP_SUBNET_BASE}.1.100", "interface": "eth0", "connection_type": "ethernet"},
                 ["device"]
             ),
             AlertTemplate(
@@ -128,7 +129,7 @@ class AlertGenerator:
                 AlertType.SECURITY,
                 AlertSeverity.CRITICAL,
                 "Multiple failed SSH login attempts: {attempts} from {source_ip}",
-                {"attempts": 15, "source_ip": f"{GenerationConstants().IP_SUBNET_BASE}.1.200", "service": "ssh"},
+                {"attempts": 15, "source_ip": f"{GENERATION_CONSTANTS.IP_SUBNET_BASE}.1.200", "service": "ssh"},
                 ["device"]
             ),
             
@@ -345,16 +346,14 @@ class AlertGenerator:
         alert_file_name = self.app_config.get_file_name("alerts")
         alert_file_path = tenant_data_dir / alert_file_name
 
-        with open(alert_file_path, 'w') as f:
-            json.dump(alert_documents, f, indent=2)
+        write_json_array(alert_file_path, alert_documents)
 
         logger.info(f"   [ALERT] Saved {len(alert_documents)} alert documents to {alert_file_name}")
 
         hasAlert_file_name = self.app_config.get_file_name("has_alerts")
         hasAlert_file_path = tenant_data_dir / hasAlert_file_name
 
-        with open(hasAlert_file_path, 'w') as f:
-            json.dump(hasAlert_edges, f, indent=2)
+        write_json_array(hasAlert_file_path, hasAlert_edges)
 
         logger.info(f"   [ALERT] Saved {len(hasAlert_edges)} hasAlert edges to {hasAlert_file_name}")
         
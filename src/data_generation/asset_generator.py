@@ -9,23 +9,24 @@ Implements consistent time travel pattern across ALL collections:
 - Multi-tenant disjoint SmartGraphs
 """
 
-import json
 import datetime
 import logging
+import os
 import sys
 import uuid
 import random
-from typing import Dict, List, Any, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
 # Import centralized configuration
 from src.config.config_management import get_config, initialize_logging, NamingConvention
-from src.config.tenant_config import TenantConfig, TenantNamingConvention, create_tenant_config
+from src.config.tenant_config import TenantConfig, TenantNamingConvention, TemporalDataModel, create_tenant_config
 from src.ttl.ttl_constants import NEVER_EXPIRES
 from src.data_generation.data_generation_utils import (
     DocumentEnhancer, RandomDataGenerator, KeyGenerator,
     DeviceConfigurationManager, FileManager, LocationDataProvider,
-    SmartGraphConfigGenerator, EntityGenerator
+    SmartGraphConfigGenerator, EntityGenerator, first_token
 )
 from src.data_generation.alert_generator import AlertGenerator
 from src.data_generation.taxonomy_generator import TaxonomyGenerator
@@ -44,6 +45,13 @@ class AssetGenerator:
         self.app_config = get_config(environment, naming_convention)
         self.naming = TenantNamingConvention(tenant_config.tenant_id)
         
+        # Proxy documents carry only static tenant attributes; build them once per tenant
+        self._proxy_attributes = TemporalDataModel.add_proxy_attributes({}, tenant_config)
+        
+        # (device type, model) drawn for each device proxy, keyed by proxy _key, so
+        # device configurations reuse the model that appears in the proxy name
+        self._device_models: Dict[str, Tuple[str, str]] = {}
+        
         from src.data_generation.data_generation_config import NetworkConfig, DataGenerationLimits
         self.network_config = NetworkConfig()
         self.limits = DataGenerationLimits()
@@ -61,12 +69,8 @@ class AssetGenerator:
         """Generate W3C OWL compliant location data."""
         self.logger.info(f"Generating {self.tenant_config.num_locations} locations for tenant {self.tenant_config.tenant_name}")
         
-        locations = []
-        
-        for i in range(self.tenant_config.num_locations):
-            loc_data = self.location_provider.get_location_data(i)
-            
-            location = {
+        locations = [
+            DocumentEnhancer.add_tenant_attributes({
                 "_key": KeyGenerator.generate_tenant_key(
                     self.tenant_config.tenant_id, "location", i + 1
                 ),
@@ -76,10 +80,11 @@ class AssetGenerator:
                     "type": "Point",
                     "coordinates": [loc_data["lon"], loc_data["lat"]]
                 }
-            }
-            
-            location = DocumentEnhancer.add_tenant_attributes(location, self.tenant_config)
-            locations.append(location)
+            }, self.tenant_config)
+            for i, loc_data in enumerate(
+                map(self.location_provider.get_location_data, range(self.tenant_config.num_locations))
+            )
+        ]
         
         self.logger.info(f"Generated {len(locations)} location entities")
         return locations
@@ -89,33 +94,48 @@ class AssetGenerator:
         """Generate DeviceProxyIn and DeviceProxyOut collections."""
         self.logger.info(f"Generating {self.tenant_config.num_devices} device proxies for tenant {self.tenant_config.tenant_name}")
         
-        device_proxy_ins = []
-        device_proxy_outs = []
-        
-        for i in range(self.tenant_config.num_devices):
-            device_type = self.random_gen.select_device_type()
-            model = self.random_gen.generate_model_name(device_type)
-            proxy_key = KeyGenerator.generate_tenant_key(
-                self.tenant_config.tenant_id, "device", i + 1
+        device_types = self.random_gen.select_device_types(self.tenant_config.num_devices)
+        models = [self.random_gen.generate_model_name(device_type) for device_type in device_types]
+        
+        # Key, shared "<tenant> <type> <model> proxy " name prefix and type value per device
+        tenant_id = self.tenant_config.tenant_id
+        tenant_name = self.tenant_config.tenant_name
+        proxy_specs = [
+            (
+                KeyGenerator.generate_tenant_key(tenant_id, "device", i + 1),
+                f"{tenant_name} {device_type} {model} proxy ",
+                device_type
             )
-            
-            # DeviceProxyIn - no temporal attributes, only tenant key
-            device_proxy_in = {
+            for i, (device_type, model) in enumerate(zip(device_types, models))
+        ]
+        self._device_models = {
+            spec[0]: (device_type, model)
+            for spec, device_type, model in zip(proxy_specs, device_types, models)
+        }
+        
+        proxy_attributes = self._proxy_attributes
+        
+        # DeviceProxyIn - no temporal attributes, only tenant key
+        device_proxy_ins = [
+            {
                 "_key": proxy_key,
-                "name": f"{self.tenant_config.tenant_name} {device_type.value} {model} proxy in",
-                "type": device_type.value
+                "name": name_prefix + "in",
+                "type": type_value,
+                **proxy_attributes
             }
-            device_proxy_in = DocumentEnhancer.add_tenant_attributes(device_proxy_in, self.tenant_config, is_proxy=True)
-            device_proxy_ins.append(device_proxy_in)
-            
-            # DeviceProxyOut - no temporal attributes, only tenant key  
-            device_proxy_out = {
+            for proxy_key, name_prefix, type_value in proxy_specs
+        ]
+        
+        # DeviceProxyOut - no temporal attributes, only tenant key
+        device_proxy_outs = [
+            {
                 "_key": proxy_key,
-                "name": f"{self.tenant_config.tenant_name} {device_type.value} {model} proxy out",
-                "type": device_type.value
+                "name": name_prefix + "out",
+                "type": type_value,
+                **proxy_attributes
             }
-            device_proxy_out = DocumentEnhancer.add_tenant_attributes(device_proxy_out, self.tenant_config, is_proxy=True)
-            device_proxy_outs.append(device_proxy_out)
+            for proxy_key, name_prefix, type_value in proxy_specs
+        ]
         
         self.logger.info(f"Generated {len(device_proxy_ins)} DeviceProxyIn and {len(device_proxy_outs)} DeviceProxyOut entities")
         return device_proxy_ins, device_proxy_outs
@@ -124,54 +144,64 @@ class AssetGenerator:
         """Generate versioned Device configurations."""
         self.logger.info(f"Generating device configurations with {self.tenant_config.num_config_changes} historical versions")
         
-        devices = []
-        versions = []
+        # Each device occupies (1 + num_config_changes) consecutive slots (current
+        # first, then history) and two version edges per slot, so sizes are known
+        slots_per_device = 1 + self.tenant_config.num_config_changes
+        devices = [None] * (len(device_proxy_ins) * slots_per_device)
+        versions = [None] * (len(devices) * 2)
+        
+        # Bind hot lookups once; the loop body runs once per device
+        tenant_config = self.tenant_config
+        tenant_id = tenant_config.tenant_id
+        tenant_name = tenant_config.tenant_name
+        random_gen = self.random_gen
+        default_firewall_rules = self.network_config.DEFAULT_FIREWALL_RULES
+        # Keys follow KeyGenerator.generate_tenant_key, formatted inline in this hot loop
+        device_key_prefix = f"{tenant_id}:device"
+        add_tenant_attributes = DocumentEnhancer.add_tenant_attributes
+        create_version_edges = self._create_version_edges
+        generate_history = self._generate_historical_device_configurations
+        device_models = self._device_models
         
         for i, device_proxy_in in enumerate(device_proxy_ins):
-            device_type_str = device_proxy_in["type"]
-            from src.data_generation.data_generation_config import DeviceType
-            device_type = DeviceType(device_type_str)
-            
-            os_version = self.random_gen.select_os_version(device_type)
-            model = self.random_gen.generate_model_name(device_type)
             proxy_key = device_proxy_in["_key"]
+            device_model = device_models.get(proxy_key)
+            if device_model is None:
+                # Proxies not produced by generate_device_proxies on this instance
+                device_type = device_proxy_in["type"]
+                device_model = (device_type, random_gen.generate_model_name(device_type))
+            device_type, model = device_model
+            
+            os_version = random_gen.select_os_version(device_type)
             
             # Generate current configuration
-            current_device_key = KeyGenerator.generate_tenant_key(
-                self.tenant_config.tenant_id, "device", i + 1, 0
-            )
+            current_device_key = f"{device_key_prefix}{i + 1}-0"
             current_created = datetime.datetime.now()
             
             current_config = {
                 "_key": current_device_key,
-                "name": f"{self.tenant_config.tenant_name} {device_type.value} {model}",
-                "type": device_type.value,
+                "name": f"{tenant_name} {device_type} {model}",
+                "type": device_type,
                 "model": model,
                 "serialNumber": str(uuid.uuid4()),
-                "ipAddress": self.random_gen.generate_ip_address(),
-                "macAddress": self.random_gen.generate_mac_address(),
-                "operatingSystem": os_version.split(" ")[0],
+                "ipAddress": random_gen.generate_ip_address(),
+                "macAddress": random_gen.generate_mac_address(),
+                "operatingSystem": first_token(os_version),
                 "osVersion": os_version,
-                "hostName": self.random_gen.generate_hostname(self.tenant_config.tenant_id, i + 1),
-                "firewallRules": self.network_config.DEFAULT_FIREWALL_RULES.copy()
+                "hostName": random_gen.generate_hostname(tenant_id, i + 1),
+                "firewallRules": default_firewall_rules
             }
-            current_config = DocumentEnhancer.add_tenant_attributes(
-                current_config, self.tenant_config, current_created
-            )
-            devices.append(current_config)
+            current_config = add_tenant_attributes(current_config, tenant_config, current_created)
+            slot = i * slots_per_device
+            devices[slot] = current_config
             
             # Create version edges for current configuration
-            current_versions = self._create_version_edges(
+            versions[2 * slot:2 * slot + 2] = create_version_edges(
                 "device", proxy_key, current_device_key, current_created
             )
-            versions.extend(current_versions)
             
-            # Generate historical configurations
-            historical_devices, historical_versions = self._generate_historical_device_configurations(
-                current_config, proxy_key, i + 1
-            )
-            devices.extend(historical_devices)
-            versions.extend(historical_versions)
+            # Generate historical configurations into the following slots
+            generate_history(current_config, proxy_key, i + 1, devices, versions, slot)
         
         self.logger.info(f"Generated {len(devices)} device configurations and {len(versions)} device version edges")
         return devices, versions
@@ -223,27 +253,24 @@ class AssetGenerator:
         return [version_in, version_out]
     
     def _generate_historical_device_configurations(self, current_config: Dict[str, Any], 
-                                                 proxy_key: str, device_index: int) -> Tuple[List[Dict], List[Dict]]:
-        """Generate historical device configurations with proper temporal attributes."""
-        historical_devices = []
-        historical_versions = []
-        
+                                                 proxy_key: str, device_index: int,
+                                                 devices: List[Dict], versions: List[Dict], slot: int) -> None:
+        """
+        Generate historical device configurations with proper temporal attributes.
+        
+        Writes change N into devices[slot + N] and its version edges into
+        versions[2 * (slot + N)] and the next index (preallocated by the caller).
+        """
+        now_ref = datetime.datetime.now()
+        # Same format as KeyGenerator.generate_tenant_key, with the base key built once
+        base_key = f"{self.tenant_config.tenant_id}:device{device_index}"
         for change_no in range(self.tenant_config.num_config_changes):
             previous_config = self.config_manager.apply_device_configuration_change(current_config)
-            key = KeyGenerator.generate_tenant_key(
-                self.tenant_config.tenant_id, "device", device_index, change_no + 1
-            )
+            key = f"{base_key}-{change_no + 1}"
             previous_config["_key"] = key
             
-            # Ensure proper W3C OWL property naming
-            if "hostname" in previous_config:
-                previous_config["hostName"] = previous_config.pop("hostname")
-            elif "_key" in previous_config:
-                tenant_id = previous_config["_key"].split("_")[0]
-                previous_config["hostName"] = self.random_gen.generate_random_hostname(tenant_id)
-            
             # Set temporal timestamps
-            created = datetime.datetime.now() - datetime.timedelta(
+            created = now_ref - datetime.timedelta(
                 days=random.randint(change_no*5+1, (change_no+1)*5)
             )
             expired = previous_config["created"]  # Historical records expire when replaced
@@ -251,56 +278,65 @@ class AssetGenerator:
             previous_config = DocumentEnhancer.add_tenant_attributes(
                 previous_config, self.tenant_config, created, expired
             )
-            historical_devices.append(previous_config)
+            history_slot = slot + change_no + 1
+            devices[history_slot] = previous_config
             
             # Create version edges for historical configuration
             historical_version_edges = self._create_version_edges("device", proxy_key, key, created)
             for edge in historical_version_edges:
                 edge["expired"] = expired
-            historical_versions.extend(historical_version_edges)
+            versions[2 * history_slot:2 * history_slot + 2] = historical_version_edges
             
             current_config = previous_config
-        
-        return historical_devices, historical_versions
     
     # === SOFTWARE TIME TRAVEL ===
     def generate_software_proxies(self) -> Tuple[List[Dict], List[Dict]]:
         """Generate SoftwareProxyIn and SoftwareProxyOut collections (no temporal attributes)."""
         self.logger.info(f"Generating {self.tenant_config.num_software} software proxies for tenant {self.tenant_config.tenant_name}")
         
-        software_proxy_ins = []
-        software_proxy_outs = []
-        
-        for i in range(self.tenant_config.num_software):
-            software_type = self.random_gen.select_software_type()
-            software_version = self.random_gen.select_software_version(software_type)
-            proxy_key = KeyGenerator.generate_tenant_key(
-                self.tenant_config.tenant_id, "software", i + 1
+        software_types = self.random_gen.select_software_types(self.tenant_config.num_software)
+        software_versions = [
+            self.random_gen.select_software_version(software_type) for software_type in software_types
+        ]
+        
+        # In and Out proxies share key, name, type and version
+        tenant_id = self.tenant_config.tenant_id
+        tenant_name = self.tenant_config.tenant_name
+        proxy_specs = [
+            (
+                KeyGenerator.generate_tenant_key(tenant_id, "software", i + 1),
+                f"{tenant_name} {first_token(software_version)}",
+                software_type,
+                software_version
             )
-            
-            # SoftwareProxyIn - no temporal attributes, only tenant key
-            software_proxy_in = {
+            for i, (software_type, software_version) in enumerate(zip(software_types, software_versions))
+        ]
+        
+        proxy_attributes = self._proxy_attributes
+        
+        # SoftwareProxyIn - no temporal attributes, only tenant key
+        software_proxy_ins = [
+            {
                 "_key": proxy_key,
-                "name": f"{self.tenant_config.tenant_name} {software_version.split(' ')[0]}",
-                "type": software_type.value,
-                "version": software_version
+                "name": name,
+                "type": type_value,
+                "version": software_version,
+                **proxy_attributes
             }
-            software_proxy_in = DocumentEnhancer.add_tenant_attributes(
-                software_proxy_in, self.tenant_config, is_proxy=True
-            )
-            software_proxy_ins.append(software_proxy_in)
-            
-            # SoftwareProxyOut - no temporal attributes, only tenant key  
-            software_proxy_out = {
+            for proxy_key, name, type_value, software_version in proxy_specs
+        ]
+        
+        # SoftwareProxyOut - no temporal attributes, only tenant key
+        software_proxy_outs = [
+            {
                 "_key": proxy_key,
-                "name": f"{self.tenant_config.tenant_name} {software_version.split(' ')[0]}",
-                "type": software_type.value,
-                "version": software_version
+                "name": name,
+                "type": type_value,
+                "version": software_version,
+                **proxy_attributes
             }
-            software_proxy_out = DocumentEnhancer.add_tenant_attributes(
-                software_proxy_out, self.tenant_config, is_proxy=True
-            )
-            software_proxy_outs.append(software_proxy_out)
+            for proxy_key, name, type_value, software_version in proxy_specs
+        ]
         
         self.logger.info(f"Generated {len(software_proxy_ins)} SoftwareProxyIn and {len(software_proxy_outs)} SoftwareProxyOut entities")
         return software_proxy_ins, software_proxy_outs
@@ -309,27 +345,28 @@ class AssetGenerator:
         """Generate versioned Software configurations (NO configurationHistory array)."""
         self.logger.info(f"Generating software configurations with {self.tenant_config.num_config_changes} historical versions")
         
-        software = []
-        versions = []
+        # Same slot layout as devices: current + history per entity, two version edges each
+        slots_per_software = 1 + self.tenant_config.num_config_changes
+        software = [None] * (len(software_proxy_ins) * slots_per_software)
+        versions = [None] * (len(software) * 2)
+        
+        # Keys follow KeyGenerator.generate_tenant_key, formatted inline in this hot loop
+        software_key_prefix = f"{self.tenant_config.tenant_id}:software"
         
         for i, software_proxy_in in enumerate(software_proxy_ins):
-            software_type_str = software_proxy_in["type"]
-            from src.data_generation.data_generation_config import SoftwareType
-            software_type = SoftwareType(software_type_str)
+            software_type = software_proxy_in["type"]
             
             software_version = software_proxy_in["version"]
             proxy_key = software_proxy_in["_key"]
             
             # Generate current configuration (FLATTENED - no configurationHistory array)
-            current_software_key = KeyGenerator.generate_tenant_key(
-                self.tenant_config.tenant_id, "software", i + 1, 0
-            )
+            current_software_key = f"{software_key_prefix}{i + 1}-0"
             current_created = datetime.datetime.now()
             
             current_config = {
                 "_key": current_software_key,
                 "name": software_proxy_in["name"],
-                "type": software_type.value,
+                "type": software_type,
                 "version": software_version,
                 # Flattened configuration - no configurationHistory array
                 "portNumber": self.random_gen.generate_software_port(),
@@ -338,46 +375,42 @@ class AssetGenerator:
             current_config = DocumentEnhancer.add_tenant_attributes(
                 current_config, self.tenant_config, current_created
             )
-            software.append(current_config)
+            slot = i * slots_per_software
+            software[slot] = current_config
             
             # Create version edges for current configuration
-            current_versions = self._create_version_edges(
+            versions[2 * slot:2 * slot + 2] = self._create_version_edges(
                 "software", proxy_key, current_software_key, current_created
             )
-            versions.extend(current_versions)
             
-            # Generate historical configurations (flattened, no array)
-            historical_software, historical_versions = self._generate_historical_software_configurations(
-                current_config, proxy_key, i + 1
+            # Generate historical configurations (flattened, no array) into the following slots
+            self._generate_historical_software_configurations(
+                current_config, proxy_key, i + 1, software, versions, slot
             )
-            software.extend(historical_software)
-            versions.extend(historical_versions)
         
         self.logger.info(f"Generated {len(software)} software configurations and {len(versions)} software version edges")
         return software, versions
     
     
     def _generate_historical_software_configurations(self, current_config: Dict[str, Any], 
-                                                   proxy_key: str, software_index: int) -> Tuple[List[Dict], List[Dict]]:
-        """Generate historical software configurations with proper temporal attributes."""
-        historical_software = []
-        historical_versions = []
-        
+                                                   proxy_key: str, software_index: int,
+                                                   software: List[Dict], versions: List[Dict], slot: int) -> None:
+        """
+        Generate historical software configurations with proper temporal attributes.
+        
+        Writes change N into software[slot + N] and its version edges into
+        versions[2 * (slot + N)] and the next index (preallocated by the caller).
+        """
+        now_ref = datetime.datetime.now()
+        # Same format as KeyGenerator.generate_tenant_key, with the base key built once
+        base_key = f"{self.tenant_config.tenant_id}:software{software_index}"
         for change_no in range(self.tenant_config.num_config_changes):
             previous_config = self.config_manager.apply_software_configuration_change(current_config)
-            key = KeyGenerator.generate_tenant_key(
-                self.tenant_config.tenant_id, "software", software_index, change_no + 1
-            )
+            key = f"{base_key}-{change_no + 1}"
             previous_config["_key"] = key
             
-            # Ensure W3C OWL property naming
-            if "port" in previous_config:
-                previous_config["portNumber"] = previous_config.pop("port")
-            if "enabled" in previous_config:
-                previous_config["isEnabled"] = previous_config.pop("enabled")
-            
             # Set temporal timestamps
-            created = datetime.datetime.now() - datetime.timedelta(
+            created = now_ref - datetime.timedelta(
                 days=random.randint(change_no*5+1, (change_no+1)*5)
             )
             expired = previous_config["created"]  # Historical records expire when replaced
@@ -385,64 +418,64 @@ class AssetGenerator:
             previous_config = DocumentEnhancer.add_tenant_attributes(
                 previous_config, self.tenant_config, created, expired
             )
-            historical_software.append(previous_config)
+            history_slot = slot + change_no + 1
+            software[history_slot] = previous_config
             
             # Create version edges for historical configuration
             historical_version_edges = self._create_version_edges("software", proxy_key, key, created)
             for edge in historical_version_edges:
                 edge["expired"] = expired
-            historical_versions.extend(historical_version_edges)
+            versions[2 * history_slot:2 * history_slot + 2] = historical_version_edges
             
             current_config = previous_config
-        
-        return historical_software, historical_versions
     
     # === RELATIONSHIP EDGES ===
     def generate_connections(self, device_proxy_ins: List[Dict], device_proxy_outs: List[Dict]) -> List[Dict[str, Any]]:
-        """Generate hasConnection edges ensuring better network connectivity."""
+        """
+        Generate hasConnection edges ensuring better network connectivity.
+        
+        device_proxy_ins and device_proxy_outs are the parallel lists from
+        generate_device_proxies (same device at the same index), so a pair of
+        equal indexes is a self loop.
+        """
         self.logger.info(f"Generating hasConnection edges with improved connectivity")
         
-        connections = []
-        used_pairs = set()
+        if len(device_proxy_ins) != len(device_proxy_outs):
+            raise ValueError("DeviceProxyIn and DeviceProxyOut lists must be parallel")
         
-        # Ensure we have enough unique pairs possible
-        max_possible_connections = len(device_proxy_outs) * (len(device_proxy_ins) - 1)  # Exclude self-connections
-        target_connections = min(self.tenant_config.num_connections, max_possible_connections)
+        tenant_config = self.tenant_config
+        tenant_id = tenant_config.tenant_id
+        random_gen = self.random_gen
+        create_edge_document = DocumentEnhancer.create_edge_document
+        device_out_collection = self.app_config.get_collection_name("device_outs")  # DeviceProxyOut
+        device_in_collection = self.app_config.get_collection_name("device_ins")  # DeviceProxyIn
         
-        attempts = 0
-        while len(connections) < target_connections and attempts < self.limits.MAX_GENERATION_RETRIES:
-            from_device = self.random_gen.select_random_item(device_proxy_outs)
-            to_device = self.random_gen.select_random_item(device_proxy_ins)
+        # Distinct pairs without self loops, drawn directly (no reject-and-retry loop)
+        index_pairs = random_gen.select_distinct_pairs(len(device_proxy_outs), self.tenant_config.num_connections)
+        
+        connections = []
+        for from_index, to_index in index_pairs:
+            connection_key = KeyGenerator.generate_connection_key(tenant_id, len(connections) + 1)
             
-            # Prevent self loops and duplicate connections
-            connection_pair = (from_device["_key"], to_device["_key"])
-            if from_device["_key"] != to_device["_key"] and connection_pair not in used_pairs:
-                connection_key = KeyGenerator.generate_connection_key(
-                    self.tenant_config.tenant_id, len(connections) + 1
-                )
-                
-                connection_attrs = {
-                    "connectionType": self.random_gen.select_connection_type().value,
-                    "bandwidthCapacity": self.random_gen.generate_bandwidth(),
-                    "networkLatency": self.random_gen.generate_latency()
-                }
-                
-                connection = DocumentEnhancer.create_edge_document(
-                    key=connection_key,
-                    from_collection=self.app_config.get_collection_name("device_outs"),  # DeviceProxyOut
-                    from_key=from_device["_key"],
-                    to_collection=self.app_config.get_collection_name("device_ins"),  # DeviceProxyIn
-                    to_key=to_device["_key"],
-                    from_type="DeviceProxyOut",
-                    to_type="DeviceProxyIn",
-                    tenant_config=self.tenant_config,
-                    extra_attributes=connection_attrs
-                )
-                
-                connections.append(connection)
-                used_pairs.add(connection_pair)
+            connection_attrs = {
+                "connectionType": random_gen.select_connection_type(),
+                "bandwidthCapacity": random_gen.generate_bandwidth(),
+                "networkLatency": random_gen.generate_latency()
+            }
+            
+            connection = create_edge_document(
+                key=connection_key,
+                from_collection=device_out_collection,
+                from_key=device_proxy_outs[from_index]["_key"],
+                to_collection=device_in_collection,
+                to_key=device_proxy_ins[to_index]["_key"],
+                from_type="DeviceProxyOut",
+                to_type="DeviceProxyIn",
+                tenant_config=tenant_config,
+                extra_attributes=connection_attrs
+            )
             
-            attempts += 1
+            connections.append(connection)
         
         self.logger.info(f"Generated {len(connections)} hasConnection edges")
         return connections
@@ -451,26 +484,29 @@ class AssetGenerator:
         """Generate hasLocation edges (Device -> Location relationships)."""
         self.logger.info("Generating hasLocation edges")
         
-        has_locations = []
+        # Draw every device's location in one call rather than one draw per device
+        chosen_locations = (
+            self.random_gen.select_random_items(locations, len(device_proxy_outs))
+            if device_proxy_outs else []
+        )
         
-        for device in device_proxy_outs:
-            location = self.random_gen.select_random_item(locations)
-            key = KeyGenerator.generate_has_location_key(
-                self.tenant_config.tenant_id, len(has_locations) + 1
-            )
-            
-            has_location = DocumentEnhancer.create_edge_document(
-                key=key,
-                from_collection=self.app_config.get_collection_name("device_outs"),  # DeviceProxyOut
+        tenant_id = self.tenant_config.tenant_id
+        device_outs_collection = self.app_config.get_collection_name("device_outs")  # DeviceProxyOut
+        locations_collection = self.app_config.get_collection_name("locations")  # Location
+        
+        has_locations = [
+            DocumentEnhancer.create_edge_document(
+                key=KeyGenerator.generate_has_location_key(tenant_id, i + 1),
+                from_collection=device_outs_collection,
                 from_key=device["_key"],
-                to_collection=self.app_config.get_collection_name("locations"),  # Location
+                to_collection=locations_collection,
                 to_key=location["_key"],
                 from_type="DeviceProxyOut",
                 to_type="Location",
                 tenant_config=self.tenant_config
             )
-            
-            has_locations.append(has_location)
+            for i, (device, location) in enumerate(zip(device_proxy_outs, chosen_locations))
+        ]
         
         self.logger.info(f"Generated {len(has_locations)} hasLocation edges")
         return has_locations
@@ -490,58 +526,75 @@ class AssetGenerator:
             self.logger.warning("No non-router devices available for software connections")
             return has_device_software
         
+        tenant_config = self.tenant_config
+        tenant_id = tenant_config.tenant_id
+        select_random_items = self.random_gen.select_random_items
+        generate_key = KeyGenerator.generate_has_software_key
+        create_edge_document = DocumentEnhancer.create_edge_document
+        device_out_collection = self.app_config.get_collection_name("device_outs")  # DeviceProxyOut
+        software_in_collection = self.app_config.get_collection_name("software_ins")  # SoftwareProxyIn
+        used_pairs = set()
+        
         # PHASE 1: Ensure every software entity gets at least one connection
-        for i, software_proxy in enumerate(software_proxy_ins):
-            device = self.random_gen.select_random_item(non_router_devices)
-            key = KeyGenerator.generate_has_software_key(
-                self.tenant_config.tenant_id, len(has_device_software) + 1
-            )
+        phase_one_devices = select_random_items(non_router_devices, len(software_proxy_ins))
+        for device, software_proxy in zip(phase_one_devices, software_proxy_ins):
+            key = generate_key(tenant_id, len(has_device_software) + 1)
             
-            has_device_software_edge = DocumentEnhancer.create_edge_document(
+            has_device_software_edge = create_edge_document(
                 key=key,
-                from_collection=self.app_config.get_collection_name("device_outs"),  # DeviceProxyOut
+                from_collection=device_out_collection,
                 from_key=device["_key"],
-                to_collection=self.app_config.get_collection_name("software_ins"),  # SoftwareProxyIn
+                to_collection=software_in_collection,
                 to_key=software_proxy["_key"],
                 from_type="DeviceProxyOut",
                 to_type="SoftwareProxyIn",
-                tenant_config=self.tenant_config
+                tenant_config=tenant_config
             )
             
             has_device_software.append(has_device_software_edge)
             connected_software.add(software_proxy["_key"])
+            used_pairs.add((device["_key"], software_proxy["_key"]))
         
         # PHASE 2: Add additional connections to reach target count
         attempts = 0
         target_additional = max(0, self.tenant_config.num_has_software - len(software_proxy_ins))
+        target_total = len(software_proxy_ins) + target_additional
         
-        while len(has_device_software) < len(software_proxy_ins) + target_additional and attempts < self.limits.MAX_GENERATION_RETRIES:
-            device = self.random_gen.select_random_item(non_router_devices)
-            software_proxy = self.random_gen.select_random_item(software_proxy_ins)
-            
-            # Create unique edge key to avoid duplicates
-            edge_signature = f"{device['_key']}->{software_proxy['_key']}"
-            existing_signatures = {f"{e['_from'].split('/')[1]}->{e['_to'].split('/')[1]}" for e in has_device_software}
+        max_retries = self.limits.MAX_GENERATION_RETRIES
+        
+        while software_proxy_ins and len(has_device_software) < target_total and attempts < max_retries:
+            # Pre-draw a batch of candidate pairs; refill if duplicates exhaust it
+            batch_size = min((target_total - len(has_device_software)) * 2, max_retries - attempts)
+            candidate_pairs = zip(
+                select_random_items(non_router_devices, batch_size),
+                select_random_items(software_proxy_ins, batch_size)
+            )
             
-            if edge_signature not in existing_signatures:
-                key = KeyGenerator.generate_has_software_key(
-                    self.tenant_config.tenant_id, len(has_device_software) + 1
-                )
+            for device, software_proxy in candidate_pairs:
+                if len(has_device_software) >= target_total:
+                    break
+                attempts += 1
                 
-                has_device_software_edge = DocumentEnhancer.create_edge_document(
+                # Skip device -> software pairs that already have an edge
+                edge_pair = (device["_key"], software_proxy["_key"])
+                if edge_pair in used_pairs:
+                    continue
+                
+                key = generate_key(tenant_id, len(has_device_software) + 1)
+                
+                has_device_software_edge = create_edge_document(
                     key=key,
-                    from_collection=self.app_config.get_collection_name("device_outs"),  # DeviceProxyOut
+                    from_collection=device_out_collection,
                     from_key=device["_key"],
-                    to_collection=self.app_config.get_collection_name("software_ins"),  # SoftwareProxyIn
+                    to_collection=software_in_collection,
                     to_key=software_proxy["_key"],
                     from_type="DeviceProxyOut",
                     to_type="SoftwareProxyIn",
-                    tenant_config=self.tenant_config
+                    tenant_config=tenant_config
                 )
                 
                 has_device_software.append(has_device_software_edge)
-            
-            attempts += 1
+                used_pairs.add(edge_pair)
         
         self.logger.info(f"Generated {len(has_device_software)} hasDeviceSoftware edges")
         self.logger.info(f"Connected {len(connected_software)} software entities (100% coverage)")
@@ -601,7 +654,8 @@ class AssetGenerator:
         config_file = tenant_data_path / self.app_config.get_file_name("smartgraph_config")
         FileManager.write_json_file(config_file, smartgraph_config)
         
-        total_documents = sum(len(data) for data in data_collections.values())
+        data_counts = {key: len(data) for key, data in data_collections.items()}
+        total_documents = sum(data_counts.values())
         self.logger.info(f"Completed data generation: {total_documents} total documents")
         
         self.logger.info(f"[DONE] Generated {total_documents} documents")
@@ -614,14 +668,59 @@ class AssetGenerator:
         
         return {
             "tenant_config": self.tenant_config,
-            "data_counts": {key: len(data) for key, data in data_collections.items()},
+            "data_counts": data_counts,
             "smartgraph_config": smartgraph_config,
             "data_directory": self.naming.data_directory
         }
 
 
-def generate_demo(tenant_count: int = 8, environment: str = "production", naming_convention: NamingConvention = NamingConvention.CAMEL_CASE):
-    """Generate multi-tenant demo data."""
+def _generate_tenant(tenant_config: TenantConfig, environment: str, naming_convention: NamingConvention,
+                     class_key_mapping: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Generate all data files (assets and alerts) for one tenant.
+    
+    Module-level so it can run in a worker process; the shared taxonomy is
+    passed in as its class key mapping rather than regenerated.
+    """
+    taxonomy_gen = TaxonomyGenerator(naming_convention)
+    taxonomy_gen.class_key_mapping.update(class_key_mapping)
+    
+    generator = AssetGenerator(tenant_config, environment, naming_convention,
+                               taxonomy_generator=taxonomy_gen)
+    tenant_result = generator.generate_all_data()
+    
+    # Generate alert data for this tenant
+    logger.info(f"[ALERT] Generating alerts for tenant: {tenant_config.tenant_name}")
+    tenant_data_dir = generator.app_config.paths.get_tenant_data_path(tenant_config.tenant_id)
+    alert_generator = AlertGenerator(naming_convention)
+    
+    try:
+        alert_documents, hasAlert_edges = alert_generator.generate_alert_data(
+            tenant_data_dir, 
+            active_ratio=0.7  # 70% active alerts, 30% resolved
+        )
+        alert_generator.save_alert_data(tenant_data_dir, alert_documents, hasAlert_edges)
+        
+        # Update document counts
+        tenant_result["data_counts"]["Alert"] = len(alert_documents)
+        tenant_result["data_counts"]["hasAlert"] = len(hasAlert_edges)
+        
+    except Exception as e:
+        logger.warning(f"[WARNING] Failed to generate alerts for tenant {tenant_config.tenant_name}: {e}")
+        # Continue with other tenants even if alert generation fails
+    
+    return tenant_result
+
+
+def generate_demo(tenant_count: int = 8, environment: str = "production", naming_convention: NamingConvention = NamingConvention.CAMEL_CASE,
+                  max_workers: Optional[int] = None):
+    """
+    Generate multi-tenant demo data.
+    
+    Tenants are independent, so they are generated in parallel worker processes
+    (max_workers defaults to one per tenant, capped at the CPU count). Pass
+    max_workers=1 to generate sequentially in the current process.
+    """
     
     convention_name = "camelCase" if naming_convention == NamingConvention.CAMEL_CASE else "snake_case"
     logger.info(f"Multi-Tenant Network Asset Generation ({convention_name})")
@@ -673,34 +772,25 @@ def generate_demo(tenant_count: int = 8, environment: str = "production", naming
     total_documents += len(taxonomy_data["classes"]) + len(taxonomy_data["subclass_edges"])
     
     # Generate per-tenant data (type edges reference the shared taxonomy keys)
-    alert_generator = AlertGenerator(naming_convention)
+    if max_workers is None:
+        max_workers = min(len(tenant_configs), os.cpu_count() or 1)
+    
+    tenant_args = (
+        tenant_configs,
+        [environment] * len(tenant_configs),
+        [naming_convention] * len(tenant_configs),
+        [taxonomy_gen.class_key_mapping] * len(tenant_configs)
+    )
     
-    for tenant_config in tenant_configs:
-        generator = AssetGenerator(tenant_config, environment, naming_convention,
-                                   taxonomy_generator=taxonomy_gen)
-        tenant_result = generator.generate_all_data()
+    if max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            tenant_results = list(executor.map(_generate_tenant, *tenant_args))
+    else:
+        tenant_results = list(map(_generate_tenant, *tenant_args))
+    
+    for tenant_config, tenant_result in zip(tenant_configs, tenant_results):
         results[tenant_config.tenant_id] = tenant_result
         total_documents += sum(tenant_result["data_counts"].values())
-        
-        # Generate alert data for this tenant
-        logger.info(f"[ALERT] Generating alerts for tenant: {tenant_config.tenant_name}")
-        tenant_data_dir = app_config.paths.get_tenant_data_path(tenant_config.tenant_id)
-        
-        try:
-            alert_documents, hasAlert_edges = alert_generator.generate_alert_data(
-                tenant_data_dir, 
-                active_ratio=0.7  # 70% active alerts, 30% resolved
-            )
-            alert_generator.save_alert_data(tenant_data_dir, alert_documents, hasAlert_edges)
-            
-            # Update document counts
-            results[tenant_config.tenant_id]["data_counts"]["Alert"] = len(alert_documents)
-            results[tenant_config.tenant_id]["data_counts"]["hasAlert"] = len(hasAlert_edges)
-            total_documents += len(alert_documents) + len(hasAlert_edges)
-            
-        except Exception as e:
-            logger.warning(f"[WARNING] Failed to generate alerts for tenant {tenant_config.tenant_name}: {e}")
-            # Continue with other tenants even if alert generation fails
     
     # Generate centralized tenant registry
     tenant_registry = {
@@ -737,8 +827,7 @@ def generate_demo(tenant_count: int = 8, environment: str = "production", naming
     }
     
     registry_path = app_config.paths.data_directory / "tenant_registry_time_travel.json"
-    with open(registry_path, "w") as f:
-        json.dump(tenant_registry, f, indent=2)
+    FileManager.write_json_file(registry_path, tenant_registry)
     
     logger.info(f"\n[SUCCESS] Data generation completed!")
     logger.info(f"[DATA] Generated {total_documents} documents across {len(tenant_configs)} tenants")
@@ -759,11 +848,13 @@ if __name__ == "__main__":
                        help="Naming convention for collections and properties (camelCase only)")
     parser.add_argument("--environment", choices=["production", "development"], default="production",
                        help="Environment configuration (default: production)")
+    parser.add_argument("--workers", type=int, default=None,
+                       help="Worker processes for per-tenant generation (default: one per tenant, up to CPU count)")
     
     args = parser.parse_args()
     
     # Convert naming argument to enum
     naming_convention = NamingConvention.CAMEL_CASE if args.naming == "camelCase" else NamingConvention.SNAKE_CASE
     
-    results = generate_demo(args.tenants, args.environment, naming_convention)
+    results = generate_demo(args.tenants, args.environment, naming_convention, max_workers=args.workers)
     print(f"\n[DONE] Ready for deployment with {args.naming} naming convention!")
@@ -5,40 +5,42 @@ Centralized configuration for multi-tenant network asset generation.
 Eliminates hard-coded values and provides consistent defaults.
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 from dataclasses import dataclass
-from enum import Enum
-from src.config.generation_constants import GENERATION_CONSTANTS, NETWORK_CONSTANTS, LOCATION_CONSTANTS, OS_CONSTANTS
+from src.config.generation_constants import GENERATION_CONSTANTS, NETWORK_CONSTANTS, OS_CONSTANTS
 
 
-class DeviceType(Enum):
-    """Device types with consistent string values."""
+class DeviceType:
+    """Device types as plain string constants; ALL lists every type."""
     SERVER = "server"
     ROUTER = "router"
     LAPTOP = "laptop"
     IOT = "IoT"
     FIREWALL = "firewall"
+    ALL: Tuple[str, ...] = (SERVER, ROUTER, LAPTOP, IOT, FIREWALL)
 
 
-class ConnectionType(Enum):
-    """Network connection types."""
+class ConnectionType:
+    """Network connection types as plain string constants."""
     ETHERNET = "ethernet"
     WIFI = "wifi"
     FIBER = "fiber"
+    ALL: Tuple[str, ...] = (ETHERNET, WIFI, FIBER)
 
 
-class SoftwareType(Enum):
-    """Software categories."""
+class SoftwareType:
+    """Software categories as plain string constants."""
     APPLICATION = "application"
     DATABASE = "database"
     SERVICE = "service"
+    ALL: Tuple[str, ...] = (APPLICATION, DATABASE, SERVICE)
 
 
 @dataclass
 class NetworkConfig:
     """Network configuration constants."""
-    # Default firewall rules
-    DEFAULT_FIREWALL_RULES: List[str] = None
+    # Default firewall rules (immutable, shared by every generated device)
+    DEFAULT_FIREWALL_RULES: Tuple[str, ...] = GENERATION_CONSTANTS.DEFAULT_FIREWALL_RULES
     
     # Port ranges
     DYNAMIC_PORT_MIN: int = GENERATION_CONSTANTS.DYNAMIC_PORT_MIN
@@ -56,10 +58,6 @@ class NetworkConfig:
     BANDWIDTH_MAX: int = GENERATION_CONSTANTS.BANDWIDTH_MAX
     LATENCY_MIN: int = 1
     LATENCY_MAX: int = 10
-    
-    def __post_init__(self):
-        if self.DEFAULT_FIREWALL_RULES is None:
-            self.DEFAULT_FIREWALL_RULES = GENERATION_CONSTANTS.DEFAULT_FIREWALL_RULES
 
 
 @dataclass
@@ -78,42 +76,42 @@ class DataGenerationLimits:
 
 
 # Device type configurations
-DEVICE_OS_VERSIONS: Dict[DeviceType, List[str]] = {
+DEVICE_OS_VERSIONS: Dict[str, Tuple[str, ...]] = {
     DeviceType.SERVER: OS_CONSTANTS.DEVICE_OPERATING_SYSTEMS,
-    DeviceType.ROUTER: [
+    DeviceType.ROUTER: (
         "IOS XE 17.6.4a", 
         "JUNOS 21.2R3-S1",
         "IOS XE 17.9.3a",
         "JUNOS 22.1R1",
         "pfSense 2.6.0"
-    ],
-    DeviceType.LAPTOP: [
+    ),
+    DeviceType.LAPTOP: (
         "Windows 10 Pro 21H2", 
         "macOS Monterey 12.4", 
         "Ubuntu 22.04 LTS",
         "Windows 11 Pro 22H2",
         "macOS Ventura 13.2",
         "Fedora 37 Workstation"
-    ],
-    DeviceType.IOT: [
+    ),
+    DeviceType.IOT: (
         "Embedded Linux 4.14.247", 
         "FreeRTOS 10.4.6",
         "Embedded Linux 5.4.188",
         "FreeRTOS 10.5.1",
         "Zephyr 3.2.0"
-    ],
-    DeviceType.FIREWALL: [
+    ),
+    DeviceType.FIREWALL: (
         "FortiOS 7.0.9", 
         "pfSense 2.5.2",
         "FortiOS 7.2.4",
         "pfSense 2.6.0",
         "OpnSense 22.7"
-    ]
+    )
 }
 
 # Software configurations
-SOFTWARE_VERSIONS: Dict[SoftwareType, List[str]] = {
-    SoftwareType.APPLICATION: [
+SOFTWARE_VERSIONS: Dict[str, Tuple[str, ...]] = {
+    SoftwareType.APPLICATION: (
         "Apache HTTP Server 2.4.53", 
         "Nginx 1.22.0", 
         "Python 3.10.6",
@@ -121,8 +119,8 @@ SOFTWARE_VERSIONS: Dict[SoftwareType, List[str]] = {
         "Nginx 1.24.0",
         "Python 3.11.3",
         "Node.js 18.16.0"
-    ],
-    SoftwareType.DATABASE: [
+    ),
+    SoftwareType.DATABASE: (
         "MySQL 8.0.30", 
         "PostgreSQL 14.5", 
         "MongoDB 6.0.2",
@@ -130,8 +128,8 @@ SOFTWARE_VERSIONS: Dict[SoftwareType, List[str]] = {
         "PostgreSQL 15.3",
         "MongoDB 6.0.6",
         "Redis 7.0.11"
-    ],
-    SoftwareType.SERVICE: [
+    ),
+    SoftwareType.SERVICE: (
         "OpenSSH 8.9p1", 
         "Docker 20.10.17", 
         "Kubernetes 1.25.2",
@@ -139,7 +137,7 @@ SOFTWARE_VERSIONS: Dict[SoftwareType, List[str]] = {
         "Docker 24.0.2",
         "Kubernetes 1.27.2",
         "Consul 1.15.3"
-    ]
+    )
 }
 
 # Default location data (can be extended)
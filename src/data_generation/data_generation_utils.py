@@ -4,14 +4,18 @@ Data Generation Utilities
 Reusable utility functions to eliminate code duplication in multi-tenant data generation.
 """
 
+import functools
 import random
 import uuid
 import datetime
-from typing import Dict, List, Any, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple, Union
 from pathlib import Path
-from src.config.generation_constants import NETWORK_CONSTANTS
+from src.config.generation_constants import GENERATION_CONSTANTS, NETWORK_CONSTANTS
+from src.utils.json_io import write_json_file, write_json_array
 
-from src.config.tenant_config import TenantConfig, TenantNamingConvention, TemporalDataModel
+from src.config.tenant_config import TenantConfig, TenantNamingConvention, TemporalDataModel, SmartGraphDefinition
 from src.data_generation.data_generation_config import (
     DeviceType, ConnectionType, SoftwareType, NetworkConfig, DataGenerationLimits,
     DEVICE_OS_VERSIONS, SOFTWARE_VERSIONS, DEFAULT_LOCATIONS_DATA,
@@ -23,6 +27,46 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=128)
+def first_token(version_string: str) -> str:
+    """
+    Return the product/OS name from a version string (e.g. "Nginx 1.22.0" -> "Nginx").
+    
+    Version strings come from small fixed catalogs, so results are memoized.
+    """
+    return version_string.split(" ", 1)[0]
+
+
+# Per-tenant collection types written by FileManager.write_tenant_data_files
+TENANT_DATA_FILE_TYPES: Tuple[str, ...] = (
+    "devices", "device_ins", "device_outs", "locations",
+    "software", "software_ins", "software_outs",
+    "connections", "has_locations", "has_software", "has_device_software",
+    "versions", "types"
+)
+
+
+@functools.lru_cache(maxsize=8)
+def tenant_file_mapping(app_config) -> Mapping[str, str]:
+    """Return the read-only collection type -> file name mapping for a configuration."""
+    return MappingProxyType({
+        collection_type: app_config.get_file_name(collection_type)
+        for collection_type in TENANT_DATA_FILE_TYPES
+    })
+
+
+@functools.lru_cache(maxsize=128)
+def tenant_naming(tenant_id: str) -> TenantNamingConvention:
+    """Return the shared naming convention for a tenant (derived from tenant_id only)."""
+    return TenantNamingConvention(tenant_id)
+
+
+@functools.lru_cache(maxsize=128)
+def tenant_smartgraph_definition(tenant_id: str) -> SmartGraphDefinition:
+    """Return the shared SmartGraph definition for a tenant."""
+    return SmartGraphDefinition(tenant_naming(tenant_id))
+
+
 class DocumentEnhancer:
     """Centralized document enhancement utilities."""
     
@@ -39,10 +83,8 @@ class DocumentEnhancer:
         For proxy collections (DeviceProxyIn/DeviceProxyOut), only adds tenant attributes.
         """
         if is_proxy:
-            from src.config.tenant_config import TemporalDataModel
             return TemporalDataModel.add_proxy_attributes(document, tenant_config)
         else:
-            from src.config.tenant_config import TemporalDataModel
             return TemporalDataModel.add_temporal_attributes(
                 document,
                 timestamp=timestamp,
@@ -99,16 +141,20 @@ class RandomDataGenerator:
     
     def generate_ip_address(self) -> str:
         """Generate a random IP address in the configured subnet."""
-        return f"{self.config.IP_SUBNET_BASE}.{random.randint(self.config.IP_RANGE_MIN, self.config.IP_RANGE_MAX)}.{random.randint(self.config.IP_RANGE_MIN, self.config.IP_RANGE_MAX)}"
+        # Draw both octets in one call and split them, instead of two randint calls
+        config = self.config
+        span = config.IP_RANGE_MAX - config.IP_RANGE_MIN + 1
+        third, fourth = divmod(random.randrange(span * span), span)
+        return f"{config.IP_SUBNET_BASE}.{config.IP_RANGE_MIN + third}.{config.IP_RANGE_MIN + fourth}"
     
     def generate_mac_address(self) -> str:
         """Generate a random MAC address."""
-        return ":".join(f"{random.randint(0, NETWORK_CONSTANTS.MAC_ADDRESS_MAX_VALUE):02x}" for _ in range(NETWORK_CONSTANTS.MAC_ADDRESS_SEGMENTS))
+        return random.randbytes(NETWORK_CONSTANTS.MAC_ADDRESS_SEGMENTS).hex(":")
     
-    def generate_model_name(self, device_type: DeviceType) -> str:
+    def generate_model_name(self, device_type: str) -> str:
         """Generate a model name for a device type."""
         model_number = random.randint(self.limits.MODEL_NUMBER_MIN, self.limits.MODEL_NUMBER_MAX)
-        return f"{device_type.value.capitalize()} Model {model_number}"
+        return f"{device_type.capitalize()} Model {model_number}"
     
     def generate_hostname(self, tenant_id: str, device_index: int) -> str:
         """Generate a hostname for a device."""
@@ -138,31 +184,68 @@ class RandomDataGenerator:
         """Generate a random port for software configuration."""
         return random.randint(self.config.SOFTWARE_PORT_MIN, self.config.SOFTWARE_PORT_MAX)
     
-    def select_device_type(self) -> DeviceType:
+    def select_device_type(self) -> str:
         """Select a random device type."""
-        return random.choice(list(DeviceType))
+        return random.choice(DeviceType.ALL)
+    
+    def select_device_types(self, count: int) -> List[str]:
+        """Select count random device types in one draw."""
+        return random.choices(DeviceType.ALL, k=count)
     
-    def select_os_version(self, device_type: DeviceType) -> str:
+    def select_os_version(self, device_type: str) -> str:
         """Select a random OS version for a device type."""
         return random.choice(DEVICE_OS_VERSIONS[device_type])
     
-    def select_software_type(self) -> SoftwareType:
+    def select_software_type(self) -> str:
         """Select a random software type."""
-        return random.choice(list(SoftwareType))
+        return random.choice(SoftwareType.ALL)
     
-    def select_software_version(self, software_type: SoftwareType) -> str:
+    def select_software_types(self, count: int) -> List[str]:
+        """Select count random software types in one draw."""
+        return random.choices(SoftwareType.ALL, k=count)
+    
+    def select_software_version(self, software_type: str) -> str:
         """Select a random software version for a software type."""
         return random.choice(SOFTWARE_VERSIONS[software_type])
     
-    def select_connection_type(self) -> ConnectionType:
+    def select_connection_type(self) -> str:
         """Select a random connection type."""
-        return random.choice(list(ConnectionType))
+        return random.choice(ConnectionType.ALL)
     
     def select_random_item(self, items: List[Any]) -> Any:
         """Select a random item from a list."""
         if not items:
             raise ValueError("Cannot select from empty list")
         return random.choice(items)
+    
+    def select_random_items(self, items: List[Any], count: int) -> List[Any]:
+        """Select count random items (with replacement) from a list in one draw."""
+        if not items:
+            raise ValueError("Cannot select from empty list")
+        return random.choices(items, k=count)
+    
+    def select_distinct_pairs(self, num_items: int, count: int) -> List[Tuple[int, int]]:
+        """
+        Select count distinct ordered (from, to) index pairs with from != to.
+        
+        Samples without replacement from the num_items * (num_items - 1) space
+        of non-self pairs, so no draw is ever rejected or retried.
+        
+        Args:
+            num_items: Number of items pairs are drawn from
+            count: Number of pairs (capped at the number of possible pairs)
+            
+        Returns:
+            List of (from_index, to_index) tuples
+        """
+        if num_items < 2:
+            return []
+        others = num_items - 1
+        pairs = []
+        for pair_index in random.sample(range(num_items * others), min(count, num_items * others)):
+            from_index, offset = divmod(pair_index, others)
+            pairs.append((from_index, offset + (offset >= from_index)))
+        return pairs
 
 
 class KeyGenerator:
@@ -237,11 +320,14 @@ class DeviceConfigurationManager:
         """
         Apply a random configuration change to a device.
         
+        Firewall rules may be a tuple shared across configurations, so changes
+        build a new list rather than mutating the current one in place.
+        
         Args:
             config: Current device configuration
             
         Returns:
-            Modified configuration
+            Modified configuration (W3C OWL property names, e.g. hostName)
         """
         new_config = config.copy()
         
@@ -250,19 +336,18 @@ class DeviceConfigurationManager:
             if random.random() < 0.5:
                 # Add firewall rule
                 new_rule = self.random_generator.generate_firewall_rule()
-                if "firewallRules" not in new_config:
-                    new_config["firewallRules"] = []
-                new_config["firewallRules"].append(new_rule)
+                new_config["firewallRules"] = [*new_config.get("firewallRules", ()), new_rule]
             else:
                 # Remove firewall rule
-                if "firewallRules" in new_config and len(new_config["firewallRules"]) > 0:
-                    index = random.randint(0, len(new_config["firewallRules"]) - 1)
-                    new_config["firewallRules"].pop(index)
+                rules = new_config.get("firewallRules")
+                if rules:
+                    index = random.randint(0, len(rules) - 1)
+                    new_config["firewallRules"] = [*rules[:index], *rules[index + 1:]]
         else:
-            # Change hostname
+            # Change hostname (keys use the SmartGraph "tenantId:" prefix)
             if "_key" in new_config:
-                tenant_id = new_config["_key"].split("_")[0]
-                new_config["hostname"] = self.random_generator.generate_random_hostname(tenant_id)
+                tenant_id = new_config["_key"].split(":")[0]
+                new_config["hostName"] = self.random_generator.generate_random_hostname(tenant_id)
         
         return new_config
     
@@ -274,16 +359,16 @@ class DeviceConfigurationManager:
             config: Current software configuration
             
         Returns:
-            Modified configuration
+            Modified configuration (W3C OWL property names: portNumber, isEnabled)
         """
         new_config = config.copy()
         
         if random.random() < 0.5:
             # Change port
-            new_config["port"] = self.random_generator.generate_software_port()
+            new_config["portNumber"] = self.random_generator.generate_software_port()
         else:
             # Toggle enabled status
-            new_config["enabled"] = not new_config.get("enabled", True)
+            new_config["isEnabled"] = not new_config.get("isEnabled", True)
         
         return new_config
 
@@ -302,8 +387,7 @@ class FileManager:
         Returns:
             Path to tenant directory
         """
-        naming = TenantNamingConvention(tenant_config.tenant_id)
-        data_dir = Path(naming.data_directory)
+        data_dir = Path(tenant_naming(tenant_config.tenant_id).data_directory)
         data_dir.mkdir(parents=True, exist_ok=True)
         return data_dir
     
@@ -316,21 +400,23 @@ class FileManager:
             file_path: Path to output file
             data: Data to write
         """
-        import json
-        with open(file_path, "w") as f:
-            json.dump(data, f, indent=2)
+        write_json_file(file_path, data)
     
     @staticmethod
     def write_tenant_data_files(tenant_config: TenantConfig,
                                data_collections: Dict[str, List[Dict]],
-                               app_config=None) -> None:
+                               app_config=None,
+                               max_workers: int = GENERATION_CONSTANTS.FILE_WRITE_WORKERS) -> None:
         """
         Write all tenant data files using consistent naming and formatting.
         
+        Collection files are independent, so they are written concurrently.
+        
         Args:
             tenant_config: Tenant configuration
             data_collections: Dictionary mapping collection types to data
             app_config: Application configuration (optional, uses default if None)
+            max_workers: Maximum number of files written at once
         """
         data_dir = FileManager.ensure_tenant_directory(tenant_config)
         
@@ -342,28 +428,16 @@ class FileManager:
             from src.config.config_management import get_config, NamingConvention
             cfg = get_config("production", NamingConvention.CAMEL_CASE)
 
-        file_mapping = {
-            "devices": cfg.get_file_name("devices"),
-            "device_ins": cfg.get_file_name("device_ins"),
-            "device_outs": cfg.get_file_name("device_outs"),
-            "locations": cfg.get_file_name("locations"),
-            "software": cfg.get_file_name("software"),
-            "software_ins": cfg.get_file_name("software_ins"),
-            "software_outs": cfg.get_file_name("software_outs"),
-            "connections": cfg.get_file_name("connections"),
-            "has_locations": cfg.get_file_name("has_locations"),
-            "has_software": cfg.get_file_name("has_software"),
-            "has_device_software": cfg.get_file_name("has_device_software"),
-            "versions": cfg.get_file_name("versions"),
-            "types": cfg.get_file_name("types"),
-        }
+        file_mapping = tenant_file_mapping(cfg)
         
-        total_documents = 0
-        for collection_type, data in data_collections.items():
-            if collection_type in file_mapping:
-                file_path = data_dir / file_mapping[collection_type]
-                FileManager.write_json_file(file_path, data)
-                total_documents += len(data)
+        writes = [
+            (data_dir / file_mapping[collection_type], data)
+            for collection_type, data in data_collections.items()
+            if collection_type in file_mapping
+        ]
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(writes)))) as executor:
+            futures = [executor.submit(write_json_array, file_path, data) for file_path, data in writes]
+            total_documents = sum(future.result() for future in futures)
         
         logger.info(f"Generated {len(file_mapping)} data files for tenant '{tenant_config.tenant_name}' ({tenant_config.tenant_id})")
         logger.info(f"  -> {data_dir}")
@@ -417,12 +491,13 @@ class EntityGenerator:
             proxy_key = KeyGenerator.generate_tenant_key(
                 self.tenant_config.tenant_id, entity_type, i + 1
             )
+            name = f"{self.tenant_config.tenant_name} {first_token(selected_version)}"
             
             # ProxyIn - no temporal attributes, only tenant key
             proxy_in = {
                 "_key": proxy_key,
-                "name": f"{self.tenant_config.tenant_name} {selected_version.split(' ')[0]}",
-                "type": selected_type.value,
+                "name": name,
+                "type": selected_type,
                 "version": selected_version
             }
             proxy_in = DocumentEnhancer.add_tenant_attributes(
@@ -430,17 +505,8 @@ class EntityGenerator:
             )
             proxy_ins.append(proxy_in)
             
-            # ProxyOut - no temporal attributes, only tenant key  
-            proxy_out = {
-                "_key": proxy_key,
-                "name": f"{self.tenant_config.tenant_name} {selected_version.split(' ')[0]}",
-                "type": selected_type.value,
-                "version": selected_version
-            }
-            proxy_out = DocumentEnhancer.add_tenant_attributes(
-                proxy_out, self.tenant_config, is_proxy=True
-            )
-            proxy_outs.append(proxy_out)
+            # ProxyOut has identical content; copy so the two documents stay independent
+            proxy_outs.append(dict(proxy_in))
         
         self.logger.info(f"Generated {len(proxy_ins)} {entity_type}ProxyIn and {len(proxy_outs)} {entity_type}ProxyOut entities")
         return proxy_ins, proxy_outs
@@ -501,11 +567,7 @@ class SmartGraphConfigGenerator:
         Returns:
             Complete SmartGraph configuration
         """
-        from src.config.tenant_config import SmartGraphDefinition
-        
-        naming = TenantNamingConvention(tenant_config.tenant_id)
-        smartgraph_def = SmartGraphDefinition(naming)
-        config = smartgraph_def.get_smartgraph_config()
+        config = tenant_smartgraph_definition(tenant_config.tenant_id).get_smartgraph_config()
         
         # Apply defaults from configuration
         config["options"].update(SMARTGRAPH_DEFAULTS)
@@ -23,6 +23,7 @@ from src.config.config_management import get_config, NamingConvention
 from src.config.tenant_config import TenantConfig, TemporalDataModel
 from src.ttl.ttl_constants import NEVER_EXPIRES
 from src.data_generation.data_generation_utils import KeyGenerator
+from src.utils.json_io import write_json_array
 
 import logging
 
@@ -88,18 +89,14 @@ class TaxonomyGenerator:
 
     def save_shared_taxonomy(self, taxonomy_data: Dict[str, List[Dict[str, Any]]]) -> Path:
         """Persist shared taxonomy to ``data/shared_taxonomy/``."""
-        import json
-
         out_dir = self.SHARED_TAXONOMY_DIR
         out_dir.mkdir(parents=True, exist_ok=True)
 
         classes_file = out_dir / self.app_config.get_file_name("classes")
         subclass_file = out_dir / self.app_config.get_file_name("subclass_of")
 
-        with open(classes_file, "w") as f:
-            json.dump(taxonomy_data["classes"], f, indent=2)
-        with open(subclass_file, "w") as f:
-            json.dump(taxonomy_data["subclass_edges"], f, indent=2)
+        write_json_array(classes_file, taxonomy_data["classes"])
+        write_json_array(subclass_file, taxonomy_data["subclass_edges"])
 
         logger.info(f"[TAXONOMY] Saved shared taxonomy: {len(taxonomy_data['classes'])} classes, "
                      f"{len(taxonomy_data['subclass_edges'])} subClassOf edges -> {out_dir}")
@@ -164,7 +161,7 @@ class TaxonomyGenerator:
             "description": class_def.description,
             "category": class_def.category,
             "classKey": class_def.key,  # Original taxonomy key for relationships
-            "properties": class_def.properties or {}
+            "properties": dict(class_def.properties)
         }
         
         # Add temporal attributes
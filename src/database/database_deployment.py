@@ -9,16 +9,17 @@ Deploys the time travel pattern with:
 - W3C OWL naming conventions
 """
 
-import json
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
-from arango import ArangoClient
+from typing import Dict, Any
 
 # Import centralized credentials and configuration
 from src.config.centralized_credentials import CredentialsManager
 from src.config.config_management import get_config, NamingConvention
+from src.config.generation_constants import DatabaseConstants
+from src.database.database_utilities import BulkImporter, collection_counts, create_arango_client
 from src.ttl.ttl_config import (create_ttl_configuration, create_demo_ttl_configuration, TTLManager)
 from src.ttl.ttl_constants import DEFAULT_TTL_DAYS, TTLConstants
 
@@ -33,11 +34,14 @@ class DatabaseDeployment:
         self.demo_mode = demo_mode
         self.app_config = get_config("production", naming_convention)
         creds = CredentialsManager.get_database_credentials()
-        self.client = ArangoClient(hosts=creds.endpoint)
+        self.client = create_arango_client(creds.endpoint)
         self.sys_db = None
         self.database = None
         self.creds = creds
         
+        # Collection handles for the load step, built once per deployment
+        self._collections: Dict[str, Any] = {}
+        
         # Initialize TTL configuration
         if demo_mode:
             self.ttl_config = create_demo_ttl_configuration("deployment")
@@ -202,9 +206,12 @@ class DatabaseDeployment:
                         "selectivityEstimate": ttl_spec["selectivityEstimate"],
                     })
             
+            # One listing instead of a has_collection round-trip per index
+            existing = {collection["name"] for collection in self.database.collections()}
+
             for index_config in index_configs:
                 collection_name = index_config["collection"]
-                if self.database.has_collection(collection_name):
+                if collection_name in existing:
                     collection = self.database.collection(collection_name)
                     
                     if index_config["type"] == "persistent":
@@ -273,16 +280,19 @@ class DatabaseDeployment:
             logger.error(f"Error creating indexes: {str(e)}")
             return False
     
-    def _load_json_into_collection(self, file_path: Path, collection_name: str) -> int:
-        """Load a JSON file into a collection. Returns document count."""
+    def _load_json_into_collection(self, file_path: Path, collection_name: str,
+                                   batch_bytes: int = DatabaseConstants().IMPORT_BATCH_BYTES) -> int:
+        """Load a JSON file into a collection in batches of about batch_bytes. Returns document count."""
         if not file_path.exists():
             return 0
-        with open(file_path, "r") as f:
-            data = json.load(f)
-        if not data:
-            return 0
-        self.database.collection(collection_name).insert_many(data, overwrite=True)
-        return len(data)
+        collection = self._collections.get(collection_name)
+        if collection is None:
+            collection = self.database.collection(collection_name)
+        loaded = 0
+        for batch in BulkImporter.file_batches(file_path, batch_bytes):
+            collection.insert_many(batch, overwrite=True)
+            loaded += len(batch)
+        return loaded
 
     def load_data(self) -> bool:
         """Load shared taxonomy once, then per-tenant data."""
@@ -308,7 +318,11 @@ class DatabaseDeployment:
 
             # --- Per-tenant data ---
             logger.info(f"\n[DATA] Loading tenant data...")
-            tenant_dirs = [d for d in data_dir.iterdir() if d.is_dir() and d.name.startswith("tenant_")]
+            # (tenant_id, directory) pairs, resolved once during discovery
+            tenant_dirs = [
+                (d.name[len("tenant_"):], d)
+                for d in data_dir.iterdir() if d.is_dir() and d.name.startswith("tenant_")
+            ]
 
             if not tenant_dirs:
                 logger.error(f"No tenant data directories found in {data_dir}")
@@ -331,19 +345,48 @@ class DatabaseDeployment:
                 self.app_config.get_file_name("has_alerts"): self.app_config.get_collection_name("has_alerts"),
             }
 
-            for tenant_dir in tenant_dirs:
-                tenant_id = tenant_dir.name.replace("tenant_", "")
-                logger.info(f"\n    Loading tenant: {tenant_id}")
-                tenant_total = 0
-
-                for filename, collection_name in tenant_file_mappings.items():
-                    count = self._load_json_into_collection(tenant_dir / filename, collection_name)
-                    if count:
-                        tenant_total += count
-                        total_loaded += count
-                        logger.info(f"      [DONE] {collection_name}: {count} documents")
+            self._collections = {
+                collection_name: self.database.collection(collection_name)
+                for collection_name in tenant_file_mappings.values()
+            }
 
-                logger.info(f"   [DATA] Tenant {tenant_id}: {tenant_total} documents loaded")
+            # Tenants are disjoint and files of one tenant target distinct collections,
+            # so every (tenant, file) import is queued up front on one shared pool
+            constants = DatabaseConstants()
+            max_workers = constants.IMPORT_WORKERS * min(constants.TENANT_IMPORT_WORKERS, len(tenant_dirs))
+            failed_tenants = []
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                tenant_futures = [
+                    (tenant_id, [
+                        (collection_name,
+                         executor.submit(self._load_json_into_collection, tenant_dir / filename, collection_name))
+                        for filename, collection_name in tenant_file_mappings.items()
+                    ])
+                    for tenant_id, tenant_dir in tenant_dirs
+                ]
+
+                # Collect every tenant's outcome so one failing tenant does not hide others
+                for tenant_id, futures in tenant_futures:
+                    logger.info(f"\n    Loading tenant: {tenant_id}")
+                    tenant_total = 0
+                    for collection_name, future in futures:
+                        try:
+                            count = future.result()
+                        except Exception as e:
+                            logger.error(f"      {collection_name}: {e}")
+                            if tenant_id not in failed_tenants:
+                                failed_tenants.append(tenant_id)
+                            continue
+                        if count:
+                            tenant_total += count
+                            total_loaded += count
+                            logger.debug(f"      [DONE] {collection_name}: {count} documents")
+
+                    logger.info(f"   [DATA] Tenant {tenant_id}: {tenant_total} documents loaded")
+
+            if failed_tenants:
+                logger.error(f"Data loading failed for tenants: {', '.join(failed_tenants)}")
+                return False
 
             logger.info(f"\n[DONE] Total documents loaded: {total_loaded}")
             return True
@@ -360,8 +403,9 @@ class DatabaseDeployment:
             # Single SmartGraph name for all tenants
             smartgraph_name = "network_assets_smartgraph"
             
-            # Check if SmartGraph already exists
-            if self.database.has_graph(smartgraph_name):
+            # Check if SmartGraph already exists (one listing covers both graphs)
+            existing_graphs = {graph["name"] for graph in self.database.graphs()}
+            if smartgraph_name in existing_graphs:
                 logger.info(f"   [INFO] SmartGraph '{smartgraph_name}' already exists")
                 return True
             
@@ -446,7 +490,7 @@ class DatabaseDeployment:
                 
                 # Create satellite graph for taxonomy (shared across all tenants)
                 satellite_graph_name = "taxonomy_satellite_graph"
-                if not self.database.has_graph(satellite_graph_name):
+                if satellite_graph_name not in existing_graphs:
                     satellite_edge_definitions = [
                         {
                             "edge_collection": self.app_config.get_collection_name("subclass_of"),
@@ -485,12 +529,22 @@ class DatabaseDeployment:
         try:
             logger.info(f"\n[ANALYSIS] Verifying deployment...")
             
-            # Check new Software proxy collections exist
             software_proxy_collections = ["SoftwareProxyIn", "SoftwareProxyOut"]
+            expected_collections = [
+                "Device", "DeviceProxyIn", "DeviceProxyOut", "Location", "Software",
+                "hasConnection", "hasLocation", "hasVersion"
+            ]
+            
+            # Existence and document counts for every checked collection in one snapshot
+            counts = collection_counts(
+                self.database,
+                software_proxy_collections + ["hasDeviceSoftware"] + expected_collections
+            )
+            
+            # Check new Software proxy collections exist
             for collection_name in software_proxy_collections:
-                if self.database.has_collection(collection_name):
-                    collection = self.database.collection(collection_name)
-                    count = collection.count()
+                if collection_name in counts:
+                    count = counts[collection_name]
                     logger.info(f"   [DONE] {collection_name}: {count} documents")
                 else:
                     logger.warning(f"   {collection_name}: collection not found (may be from old data)")
@@ -524,23 +578,16 @@ class DatabaseDeployment:
             logger.info(f"   [DONE] Software version edges: {software_version_count}")
             
             # Check hasDeviceSoftware collection
-            if self.database.has_collection("hasDeviceSoftware"):
-                has_device_software = self.database.collection("hasDeviceSoftware")
-                count = has_device_software.count()
+            if "hasDeviceSoftware" in counts:
+                count = counts["hasDeviceSoftware"]
                 logger.info(f"   [DONE] hasDeviceSoftware: {count} edges")
             else:
                 logger.warning(f"   hasDeviceSoftware: collection not found")
             
             # Verify all collections exist with correct names
-            expected_collections = [
-                "Device", "DeviceProxyIn", "DeviceProxyOut", "Location", "Software",
-                "hasConnection", "hasLocation", "hasVersion"
-            ]
-            
             for collection_name in expected_collections:
-                if self.database.has_collection(collection_name):
-                    collection = self.database.collection(collection_name)
-                    count = collection.count()
+                if collection_name in counts:
+                    count = counts[collection_name]
                     logger.info(f"   [DONE] {collection_name}: {count} documents")
                 else:
                     logger.error(f"Missing collection: {collection_name}")
@@ -587,14 +634,16 @@ class DatabaseDeployment:
         logger.info("")
         
         # SmartGraph creation must precede indexes and data loading because
-        # it auto-creates the vertex/edge collections (Device, Software, etc.)
+        # it auto-creates the vertex/edge collections (Device, Software, etc.).
+        # Indexes are built after the load: one pass over filled collections is
+        # far cheaper than maintaining every secondary index per inserted document.
         steps = [
             ("Connect to cluster", self.connect_to_cluster),
             ("Drop and recreate database", self.drop_and_recreate_database),
             ("Create collections", self.create_collections),
             ("Create named graphs", self.create_named_graphs),
-            ("Create indexes", self.create_indexes),
             ("Load data", self.load_data),
+            ("Create indexes", self.create_indexes),
             ("Verify deployment", self.verify_deployment),
             ("Install visualizer assets", self.install_visualizer_assets),
         ]
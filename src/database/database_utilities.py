@@ -5,21 +5,42 @@ Provides common utilities to eliminate duplicate code patterns:
 - Database connection management
 - Collection name utilities
 - Query execution helpers
+- Batched bulk imports
 - Version edge creation
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from itertools import chain, islice
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
 from arango import ArangoClient
 from arango.database import StandardDatabase
+from arango.http import DefaultHTTPClient
 from pathlib import Path
 import json
 
 from src.config.centralized_credentials import CredentialsManager, get_collection_name
+from src.config.generation_constants import DatabaseConstants
+from src.utils.json_io import deserialize_json, iter_json_array, read_json_file, serialize_json
 
 logger = logging.getLogger(__name__)
 
 
+def create_arango_client(endpoint: str) -> ArangoClient:
+    """
+    Create an ArangoDB client with the project's standard connection settings.
+    
+    Requests go through one keep-alive connection pool sized by
+    DatabaseConstants.HTTP_POOL_MAXSIZE, so repeated and concurrent queries
+    reuse warm TCP/TLS connections, and bodies are encoded with the
+    orjson-backed serializer when it is available.
+    """
+    pool_size = DatabaseConstants().HTTP_POOL_MAXSIZE
+    return ArangoClient(hosts=endpoint, serializer=serialize_json,
+                        deserializer=deserialize_json,
+                        http_client=DefaultHTTPClient(pool_connections=pool_size,
+                                                      pool_maxsize=pool_size))
+
+
 class DatabaseMixin:
     """
     Mixin class that provides standardized database connection functionality.
@@ -47,7 +68,7 @@ class DatabaseMixin:
     def client(self) -> ArangoClient:
         """Get ArangoDB client with lazy initialization."""
         if self._client is None:
-            self._client = ArangoClient(hosts=self.creds.endpoint)
+            self._client = create_arango_client(self.creds.endpoint)
         return self._client
     
     @property
@@ -77,6 +98,10 @@ class DatabaseMixin:
             logger.error("Query failed: %s", e)
             return []
     
+    def collection_counts(self, collection_names: List[str]) -> Dict[str, int]:
+        """Document counts for the given existing collections (see collection_counts)."""
+        return collection_counts(self.database, collection_names)
+    
     def get_collection(self, logical_name: str):
         """Get collection by logical name."""
         collection_name = get_collection_name(logical_name)
@@ -87,8 +112,14 @@ class QueryExecutor:
     """Common query execution functionality with optional query display."""
     
     @staticmethod
-    def execute_and_display_query(database, query: str, query_name: str, bind_vars: Dict = None, show_queries: bool = False) -> List[Dict]:
-        """Execute a query and display it with results if show_queries is enabled."""
+    def execute_and_display_query(database, query: str, query_name: str, bind_vars: Dict = None, show_queries: bool = False,
+                                  cache: Optional[bool] = None) -> List[Dict]:
+        """
+        Execute a query and display it with results if show_queries is enabled.
+        
+        cache is passed through to the AQL query results cache, which the server
+        honours when its cache mode is "on" or "demand"; None keeps the server default.
+        """
         if show_queries:
             logger.info(f"\n[QUERY] {query_name}:")
             logger.info(f"   AQL: {query}")
@@ -96,7 +127,7 @@ class QueryExecutor:
                 logger.info(f"   Variables: {bind_vars}")
         
         try:
-            cursor = database.aql.execute(query, bind_vars=bind_vars)
+            cursor = database.aql.execute(query, bind_vars=bind_vars, cache=cache)
             results = list(cursor)
             
             if show_queries:
@@ -116,6 +147,26 @@ class QueryExecutor:
         except Exception as e:
             logger.error("Query '%s' failed: %s", query_name, e)
             return []
+    
+    @staticmethod
+    def count_documents(database, collection_names: List[str]) -> Dict[str, int]:
+        """Document counts for existing collections, fetched in one AQL round-trip."""
+        if not collection_names:
+            return {}
+        fields = ", ".join(f'"{name}": LENGTH(`{name}`)' for name in collection_names)
+        return next(database.aql.execute(f"RETURN {{{fields}}}"))
+
+
+def collection_counts(database, collection_names: List[str]) -> Dict[str, int]:
+    """
+    Document counts for the given collections from one listing and one AQL round-trip.
+    
+    Collections that do not exist are left out of the result.
+    """
+    existing = {collection["name"] for collection in database.collections()}
+    return QueryExecutor.count_documents(
+        database, [name for name in collection_names if name in existing]
+    )
 
 
 class DatabaseConnectionManager(DatabaseMixin):
@@ -150,3 +201,66 @@ class DatabaseConnectionManager(DatabaseMixin):
         return 0
 
 
+class BulkImporter:
+    """
+    Splits bulk loads into requests of a bounded size.
+    
+    A single request per data file turns into one large server-side
+    transaction, while very small requests spend most of their time on HTTP
+    overhead. Batches are sized in documents from the average encoded
+    document size of the source file, so no document is serialized twice
+    just to measure it. Files above DatabaseConstants.STREAM_PARSE_BYTES
+    are parsed incrementally, so a batch can ship before the rest of the
+    file has been read.
+    """
+    
+    @staticmethod
+    def docs_per_batch(document_count: int, source_bytes: int,
+                       batch_bytes: int = DatabaseConstants().IMPORT_BATCH_BYTES) -> int:
+        """Number of documents that fit in batch_bytes given the source file size."""
+        average_bytes = max(1, source_bytes // max(1, document_count))
+        return max(1, batch_bytes // average_bytes)
+    
+    @staticmethod
+    def batches(documents: Iterable[Dict[str, Any]], batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+        """Yield consecutive lists of at most batch_size documents."""
+        iterator = iter(documents)
+        batch = list(islice(iterator, batch_size))
+        while batch:
+            yield batch
+            batch = list(islice(iterator, batch_size))
+    
+    @staticmethod
+    def file_batches(file_path: Path, batch_bytes: int = DatabaseConstants().IMPORT_BATCH_BYTES,
+                     stream_threshold: int = DatabaseConstants().STREAM_PARSE_BYTES
+                     ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield batches of about batch_bytes from a JSON array data file.
+        
+        Files of at most two bytes (an empty array) are skipped without being
+        opened. Small files are parsed whole and batched by their average
+        document size. Larger files are streamed; the document count is unknown up
+        front, so the batch size is estimated from the first document.
+        
+        Args:
+            file_path: JSON array file to read
+            batch_bytes: Target request size in bytes
+            stream_threshold: File size above which the file is streamed
+        """
+        source_bytes = file_path.stat().st_size
+        if source_bytes <= 2:
+            # Empty placeholder file ("[]" or nothing): skip the open and parse
+            return
+        if source_bytes <= stream_threshold:
+            documents = read_json_file(file_path)
+            yield from BulkImporter.batches(
+                documents, BulkImporter.docs_per_batch(len(documents), source_bytes, batch_bytes)
+            )
+            return
+        
+        documents = iter_json_array(file_path)
+        first = next(documents, None)
+        if first is None:
+            return
+        batch_size = BulkImporter.docs_per_batch(1, len(serialize_json(first)) + 2, batch_bytes)
+        yield from BulkImporter.batches(chain((first,), documents), batch_size)
@@ -36,10 +36,10 @@ Features:
 - Data loading and validation
 """
 
-import json
 import logging
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
@@ -51,7 +51,6 @@ if _mcp_path:
     sys.path.append(_mcp_path)
 
 try:
-    from arango import ArangoClient
     from arango.exceptions import (
         ArangoServerError, DatabaseCreateError, DatabaseDeleteError,
         GraphCreateError, GraphDeleteError, CollectionCreateError
@@ -60,7 +59,6 @@ except ImportError:
     logger.info("ArangoDB client not available. Installing...")
     import subprocess
     subprocess.check_call([sys.executable, "-m", "pip", "install", "python-arango"])
-    from arango import ArangoClient
     from arango.exceptions import (
         ArangoServerError, DatabaseCreateError, DatabaseDeleteError,
         GraphCreateError, GraphDeleteError, CollectionCreateError
@@ -69,12 +67,36 @@ except ImportError:
 # Import our tenant configuration and centralized credentials
 from src.config.tenant_config import TenantConfig, TenantNamingConvention, SmartGraphDefinition
 from src.data_generation.data_generation_config import DATABASE_CONFIG
+from src.config.generation_constants import DatabaseConstants
+from src.database.database_utilities import BulkImporter, create_arango_client
 from src.config.centralized_credentials import CredentialsManager
 
 
+# (data file, collection) pairs loaded for every tenant, in load order
+TENANT_DATA_FILES = (
+    ("Device.json", "devices"),
+    ("DeviceIn.json", "device_ins"),
+    ("DeviceOut.json", "device_outs"),
+    ("Location.json", "locations"),
+    ("Software.json", "software"),
+    ("hasConnection.json", "has_connections"),
+    ("hasLocation.json", "has_locations"),
+    ("hasSoftware.json", "has_software"),
+    ("version.json", "versions"),
+)
+
+
 class OasisClusterManager:
     """Manages ArangoDB Oasis cluster operations for multi-tenant demo."""
     
+    # Document counts per tenantId, gathered in one scan for all tenants
+    _TENANT_DOCUMENT_COUNTS_AQL = """
+    FOR doc IN @@collection
+    FILTER doc.tenantId != null
+    COLLECT tenantId = doc.tenantId WITH COUNT INTO count
+    RETURN [tenantId, count]
+    """
+    
     def __init__(self, environment: str = "production"):
         creds = CredentialsManager.get_database_credentials(environment)
         self.endpoint = creds.endpoint
@@ -84,6 +106,9 @@ class OasisClusterManager:
         self.client = None
         self.database = None
         
+        # Collection handles built by create_shared_collections, reused by data loading
+        self._collections: Dict[str, Any] = {}
+        
     def connect(self) -> bool:
         """
         Test connection to the Oasis cluster.
@@ -93,7 +118,7 @@ class OasisClusterManager:
         """
         try:
             logger.info(f"Connecting to ArangoDB Oasis cluster: {self.endpoint}")
-            self.client = ArangoClient(hosts=self.endpoint)
+            self.client = create_arango_client(self.endpoint)
             
             # Test connection by getting server version
             sys_db = self.client.db('_system', username=self.username, password=self.password)
@@ -181,23 +206,36 @@ class OasisClusterManager:
         ]
         
         try:
-            # Create vertex collections
-            for collection_config in vertex_collections:
-                name = collection_config["name"]
-                if not self.database.has_collection(name):
-                    self.database.create_collection(name)
-                    logger.info(f"[DONE] Created vertex collection: {name}")
-                else:
-                    logger.info(f"[INFO] Vertex collection '{name}' already exists")
-            
-            # Create edge collections
-            for collection_config in edge_collections:
+            # One listing instead of a has_collection round-trip per collection
+            existing = {collection["name"] for collection in self.database.collections()}
+            
+            # Collection creation in a cluster waits on the agency for each
+            # collection, so the missing ones are created concurrently
+            missing = [
+                collection_config for collection_config in vertex_collections + edge_collections
+                if collection_config["name"] not in existing
+            ]
+            with ThreadPoolExecutor(max_workers=max(1, len(missing))) as executor:
+                futures = [
+                    (collection_config, executor.submit(
+                        self.database.create_collection, collection_config["name"],
+                        edge=collection_config["type"] == "edge"
+                    ))
+                    for collection_config in missing
+                ]
+                created = {}
+                for collection_config, future in futures:
+                    created[collection_config["name"]] = future.result()
+                    logger.info(f"[DONE] Created {collection_config['type']} collection: {collection_config['name']}")
+            
+            self._collections = {}
+            for collection_config in vertex_collections + edge_collections:
                 name = collection_config["name"]
-                if not self.database.has_collection(name):
-                    self.database.create_collection(name, edge=True)
-                    logger.info(f"[DONE] Created edge collection: {name}")
+                if name in created:
+                    self._collections[name] = created[name]
                 else:
-                    logger.info(f"[INFO] Edge collection '{name}' already exists")
+                    logger.info(f"[INFO] {collection_config['type'].capitalize()} collection '{name}' already exists")
+                    self._collections[name] = self.database.collection(name)
             
             return True
             
@@ -303,9 +341,11 @@ class OasisClusterManager:
                 # NOTE: Redundant indexes removed - primary index handles _key, MDI handles temporal queries
             ]
             
+            existing = {collection["name"] for collection in self.database.collections()}
+            
             for index_config in index_configs:
                 collection_name = index_config["collection"]
-                if self.database.has_collection(collection_name):
+                if collection_name in existing:
                     collection = self.database.collection(collection_name)
                     
                     # TTL index creation is now handled by dedicated TTL deployment system
@@ -332,13 +372,43 @@ class OasisClusterManager:
             logger.error(f"Error creating indexes: {e}")
             return False
     
-    def load_tenant_data(self, tenant_config: TenantConfig, data_directory: str = None) -> bool:
+    def _load_data_file(self, file_path: Path, collection_name: str, batch_bytes: int) -> int:
+        """Import one tenant data file into its collection. Returns documents created."""
+        if not file_path.exists():
+            logger.warning(f"File not found: {file_path.name}")
+            return 0
+        
+        collection = self._collections.get(collection_name)
+        if collection is None:
+            collection = self.database.collection(collection_name)
+        
+        # Parse (streaming large files) and import in bounded-size requests
+        document_count = 0
+        loaded_count = 0
+        for batch in BulkImporter.file_batches(file_path, batch_bytes):
+            document_count += len(batch)
+            loaded_count += collection.import_bulk(batch).get('created', 0)
+        
+        if not document_count:
+            logger.warning(f"Empty data file: {file_path.name}")
+            return 0
+        logger.debug(f"[DONE] Loaded {loaded_count} documents into {collection_name}")
+        return loaded_count
+    
+    def load_tenant_data(self, tenant_config: TenantConfig, data_directory: str = None,
+                         batch_bytes: int = DatabaseConstants().IMPORT_BATCH_BYTES,
+                         max_workers: int = DatabaseConstants().IMPORT_WORKERS) -> bool:
         """
         Load tenant data into the database.
         
+        Each file targets a different collection, so files are parsed and
+        imported concurrently; one file's parse overlaps another's upload.
+        
         Args:
             tenant_config: Tenant configuration
             data_directory: Directory containing tenant JSON files
+            batch_bytes: Target size in bytes of each import_bulk request
+            max_workers: Number of files imported concurrently
             
         Returns:
             bool: True if successful, False otherwise
@@ -356,44 +426,13 @@ class OasisClusterManager:
             logger.error(f"Data directory not found: {data_directory}")
             return False
         
-        # Define file mappings
-        file_mappings = {
-            "Device.json": "devices",
-            "DeviceIn.json": "device_ins",
-            "DeviceOut.json": "device_outs", 
-            "Location.json": "locations",
-            "Software.json": "software",
-            "hasConnection.json": "has_connections",
-            "hasLocation.json": "has_locations",
-            "hasSoftware.json": "has_software",
-            "version.json": "versions"
-        }
-        
-        total_loaded = 0
-        
         try:
-            for filename, collection_name in file_mappings.items():
-                file_path = data_dir / filename
-                if file_path.exists():
-                    # Load JSON data
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)
-                    
-                    if data and len(data) > 0:
-                        # Get collection
-                        collection = self.database.collection(collection_name)
-                        
-                        # Import documents
-                        result = collection.import_bulk(data)
-                        
-                        loaded_count = result.get('created', 0)
-                        total_loaded += loaded_count
-                        
-                        logger.info(f"[DONE] Loaded {loaded_count} documents into {collection_name}")
-                    else:
-                        logger.warning(f"Empty data file: {filename}")
-                else:
-                    logger.warning(f"File not found: {filename}")
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self._load_data_file, data_dir / filename, collection_name, batch_bytes)
+                    for filename, collection_name in TENANT_DATA_FILES
+                ]
+                total_loaded = sum(future.result() for future in futures)
             
             logger.info(f"[DONE] Total documents loaded for tenant {tenant_config.tenant_name}: {total_loaded}")
             return True
@@ -419,39 +458,20 @@ class OasisClusterManager:
         logger.info("\n[ANALYSIS] Validating tenant isolation...")
         
         try:
+            # Auto-detect collection name (Device for W3C OWL, devices for legacy)
+            bind_vars = {"@collection": "Device" if self.database.has_collection("Device") else "devices"}
+            
+            # Count devices per standardized tenantId for all tenants in one scan
+            tenant_doc_counts = dict(self.database.aql.execute(
+                self._TENANT_DOCUMENT_COUNTS_AQL, bind_vars=bind_vars
+            ))
+            
             for tenant_config in tenant_configs:
-                # Auto-detect collection name (Device for W3C OWL, devices for legacy)
-                collection_name = "Device" if self.database.has_collection("Device") else "devices"
-                
-                # Query devices for this tenant using standardized tenantId
-                aql = f"""
-                FOR doc IN {collection_name}
-                FILTER doc.tenantId == @tenant_id
-                RETURN doc._key
-                """
-                
-                cursor = self.database.aql.execute(
-                    aql, 
-                    bind_vars={"tenant_id": tenant_config.tenant_id}
-                )
-                
-                tenant_docs = list(cursor)
-                logger.info(f"[DONE] Tenant {tenant_config.tenant_name}: {len(tenant_docs)} isolated documents")
-                
-                # Verify no cross-tenant data
-                other_tenant_aql = f"""
-                FOR doc IN {collection_name}  
-                FILTER doc.tenantId != @tenant_id AND doc.tenantId != null
-                RETURN doc._key
-                """
-                
-                other_cursor = self.database.aql.execute(
-                    other_tenant_aql,
-                    bind_vars={"tenant_id": tenant_config.tenant_id}
-                )
+                tenant_doc_count = tenant_doc_counts.get(tenant_config.tenant_id, 0)
+                logger.info(f"[DONE] Tenant {tenant_config.tenant_name}: {tenant_doc_count} isolated documents")
                 
-                other_docs = list(other_cursor)
-                if len(other_docs) == 0:
+                # Verify no cross-tenant data (documents carrying any other tenantId)
+                if all(tenant_id == tenant_config.tenant_id for tenant_id in tenant_doc_counts):
                     logger.info(f"[DONE] No cross-tenant data access for {tenant_config.tenant_name}")
                 else:
                     logger.error(f"Cross-tenant access detected for {tenant_config.tenant_name}")
@@ -483,18 +503,21 @@ class OasisClusterManager:
             # Get database info
             db_info = self.database.properties()
             
-            # Get collection statistics
+            # Get collection statistics, totalling documents in the same pass
             collections = self.database.collections()
             collection_stats = {}
+            total_documents = 0
             
             for collection in collections:
-                if not collection['name'].startswith('_'):  # Skip system collections
-                    coll = self.database.collection(collection['name'])
-                    stats = coll.statistics()
-                    collection_stats[collection['name']] = {
-                        "count": stats.get('count', 0),
+                name = collection['name']
+                if not name.startswith('_'):  # Skip system collections
+                    stats = self.database.collection(name).statistics()
+                    count = stats.get('count', 0)
+                    collection_stats[name] = {
+                        "count": count,
                         "size": stats.get('documents_size', 0)
                     }
+                    total_documents += count
             
             # Get graph information
             graphs = self.database.graphs()
@@ -505,7 +528,7 @@ class OasisClusterManager:
                 "database": db_info,
                 "collections": collection_stats,
                 "graphs": graph_info,
-                "total_documents": sum(stats["count"] for stats in collection_stats.values())
+                "total_documents": total_documents
             }
             
         except Exception as e:
@@ -14,6 +14,7 @@ import random
 import uuid
 import sys
 import time
+from collections import Counter
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
@@ -24,13 +25,13 @@ from enum import Enum
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from arango import ArangoClient
+from src.database.database_utilities import create_arango_client
 from src.config.config_management import get_config, NamingConvention
 from src.config.centralized_credentials import CredentialsManager
 from src.ttl.ttl_constants import TTLConstants, NEVER_EXPIRES
 from src.data_generation.alert_generator import AlertType, AlertSeverity, AlertStatus, AlertTemplate
 from src.utils.alert_naming import create_alert_name
-from src.config.generation_constants import GenerationConstants
+from src.config.generation_constants import GENERATION_CONSTANTS
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +45,7 @@ class AlertSimulator:
         
         # Database connection
         creds = CredentialsManager.get_database_credentials()
-        self.client = ArangoClient(hosts=creds.endpoint)
+        self.client = create_arango_client(creds.endpoint)
         self.database = self.client.db(
             creds.database_name,
             username=creds.username,
@@ -211,7 +212,7 @@ class AlertSimulator:
                 "device_name": device_proxy.get('name'),
                 "interface": "eth0",
                 "connection_type": "ethernet",
-                "target_ip": f"{GenerationConstants().IP_SUBNET_BASE}.1.1",
+                "target_ip": f"{GENERATION_CONSTANTS.IP_SUBNET_BASE}.1.1",
                 "last_seen": created_time - 30
             }
         }
@@ -304,23 +305,23 @@ class AlertSimulator:
         """Get alert summary statistics for a tenant."""
         all_alerts = self.get_tenant_alerts(tenant_id)
         
+        # One tally per field instead of one scan per counted value
+        status_counts = Counter(alert["status"] for alert in all_alerts)
+        severity_counts = Counter(alert["severity"] for alert in all_alerts)
+        type_counts = Counter(alert["alertType"] for alert in all_alerts)
+        
         summary = {
             "total_alerts": len(all_alerts),
-            "active": len([a for a in all_alerts if a["status"] == "active"]),
-            "resolved": len([a for a in all_alerts if a["status"] == "resolved"]),
+            "active": status_counts["active"],
+            "resolved": status_counts["resolved"],
             "by_severity": {
-                "critical": len([a for a in all_alerts if a["severity"] == "critical"]),
-                "warning": len([a for a in all_alerts if a["severity"] == "warning"]),
-                "info": len([a for a in all_alerts if a["severity"] == "info"])
+                "critical": severity_counts["critical"],
+                "warning": severity_counts["warning"],
+                "info": severity_counts["info"]
             },
-            "by_type": {}
+            "by_type": dict(type_counts)
         }
         
-        # Count by alert type
-        for alert in all_alerts:
-            alert_type = alert["alertType"]
-            summary["by_type"][alert_type] = summary["by_type"].get(alert_type, 0) + 1
-            
         return summary
     
     def run_alert_simulation_demo(self, tenant_id: str, num_alerts: int = 5) -> List[Dict]:
@@ -16,10 +16,12 @@ import datetime
 import logging
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from arango import ArangoClient
+from arango.database import StandardDatabase
 from arango.exceptions import (
     ArangoServerError, DatabaseCreateError, GraphCreateError, 
     CollectionCreateError, ServerConnectionError
@@ -29,10 +31,13 @@ from arango.exceptions import (
 from src.config.centralized_credentials import CredentialsManager
 from src.config.config_management import get_config, NamingConvention
 from src.config.tenant_config import TenantConfig, TenantNamingConvention, SmartGraphDefinition, create_tenant_config
+from src.config.generation_constants import DatabaseConstants
 from src.ttl.ttl_constants import TTLConstants, TTLMessages, DEFAULT_TTL_DAYS
 from src.data_generation.asset_generator import AssetGenerator
 from src.database.database_deployment import DatabaseDeployment
+from src.database.database_utilities import QueryExecutor, create_arango_client
 from src.database.oasis_cluster_setup import OasisClusterManager
+from src.utils.json_io import dumps_json
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +78,57 @@ class ScaleOutMetrics:
         }
 
 
+@dataclass
+class ClusterSnapshot:
+    """Non-system collections and their document counts at one point in time."""
+    collections: List[Dict[str, Any]]
+    document_counts: Dict[str, int]
+    fetched_at: float = field(default_factory=time.monotonic)
+    
+    @classmethod
+    def fetch(cls, database: StandardDatabase) -> 'ClusterSnapshot':
+        """Read the collection list and all document counts from the database."""
+        collections = [c for c in database.collections() if not c['system']]
+        counts = QueryExecutor.count_documents(database, [c['name'] for c in collections])
+        return cls(collections=collections, document_counts=counts)
+    
+    def is_fresh(self, ttl: float) -> bool:
+        """Check whether the snapshot is younger than ttl seconds."""
+        return time.monotonic() - self.fetched_at < ttl
+
+
+# Latest snapshot per database name, shared by all managers in the process
+_cluster_snapshots: Dict[str, ClusterSnapshot] = {}
+
+
+def get_cluster_snapshot(database: StandardDatabase, use_cache: bool = True,
+                         ttl: float = DatabaseConstants().CLUSTER_SNAPSHOT_TTL_SECONDS) -> ClusterSnapshot:
+    """
+    Get collection metadata for a database, reusing a recent snapshot.
+    
+    The server and shard managers both need the collection list and document
+    counts; sharing one snapshot avoids fetching the same metadata per manager.
+    
+    Args:
+        database: Database to describe
+        use_cache: Reuse a snapshot younger than ttl seconds
+        ttl: Maximum snapshot age in seconds
+        
+    Returns:
+        Cluster snapshot for the database
+    """
+    snapshot = _cluster_snapshots.get(database.name)
+    if not (use_cache and snapshot is not None and snapshot.is_fresh(ttl)):
+        snapshot = ClusterSnapshot.fetch(database)
+        _cluster_snapshots[database.name] = snapshot
+    return snapshot
+
+
+def invalidate_cluster_snapshot(database_name: str) -> None:
+    """Drop the cached snapshot for a database after its contents change."""
+    _cluster_snapshots.pop(database_name, None)
+
+
 class TenantAdditionManager:
     """Manages addition of new tenants to existing database."""
     
@@ -82,7 +138,7 @@ class TenantAdditionManager:
         
         # Database connection
         creds = CredentialsManager.get_database_credentials()
-        self.client = ArangoClient(hosts=creds.endpoint)
+        self.client = create_arango_client(creds.endpoint)
         self.database = None
         self.creds = creds
         
@@ -131,11 +187,11 @@ class TenantAdditionManager:
             # Get unique tenant attributes (smartgraph partitioning keys)
             aql = f"""
             FOR doc IN {device_collection}
-                COLLECT tenant_attr = doc.{self._get_tenant_attribute_field()}
+                COLLECT tenant_attr = doc[@tenant_attribute]
                 RETURN tenant_attr
             """
             
-            cursor = self.database.aql.execute(aql)
+            cursor = self.database.aql.execute(aql, bind_vars={"tenant_attribute": self._get_tenant_attribute_field()})
             tenant_attrs = list(cursor)
             
             # Extract tenant IDs from tenant attributes
@@ -282,8 +338,9 @@ class TenantAdditionManager:
             if not self.deploy_tenant_to_database(tenant_config):
                 return False, tenant_config
             
-            # Track added tenant
+            # Track added tenant; collection counts have changed
             self.added_tenants.append(tenant_config)
+            invalidate_cluster_snapshot(self.creds.database_name)
             
             logger.info(f"\n[SUCCESS] Tenant '{tenant_name}' added successfully!")
             logger.info(f"   Tenant ID: {tenant_config.tenant_id}")
@@ -296,29 +353,41 @@ class TenantAdditionManager:
             logger.error(f"Failed to add tenant: {str(e)}")
             return False, tenant_config
     
-    def add_multiple_tenants(self, tenant_specs: List[Dict[str, Any]]) -> List[Tuple[bool, TenantConfig]]:
-        """Add multiple tenants in sequence."""
+    def add_multiple_tenants(self, tenant_specs: List[Dict[str, Any]],
+                             max_workers: int = DatabaseConstants().TENANT_IMPORT_WORKERS
+                             ) -> List[Tuple[bool, TenantConfig]]:
+        """
+        Add multiple tenants concurrently.
+        
+        Each tenant is provisioned through add_tenant on a worker thread, so
+        the database round trips of different tenants overlap. Results are
+        returned in the same order as tenant_specs.
+        """
         results = []
         
         logger.info(f"\n{'='*60}")
         logger.info(f"ADDING MULTIPLE TENANTS: {len(tenant_specs)} tenants")
         logger.info(f"{'='*60}")
         
-        for i, spec in enumerate(tenant_specs, 1):
-            logger.info(f"\n[TENANT {i}/{len(tenant_specs)}]")
-            
-            success, tenant_config = self.add_tenant(
-                tenant_name=spec.get("name", f"Tenant {i}"),
-                scale_factor=spec.get("scale_factor", 1),
-                description=spec.get("description", "")
-            )
-            
-            results.append((success, tenant_config))
-            
-            if success:
-                logger.info(f"[PROGRESS] {i}/{len(tenant_specs)} tenants added successfully")
-            else:
-                logger.error(f"Failed to add tenant {i}/{len(tenant_specs)}")
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tenant_specs)))) as executor:
+            futures = [
+                executor.submit(
+                    self.add_tenant,
+                    tenant_name=spec.get("name", f"Tenant {i}"),
+                    scale_factor=spec.get("scale_factor", 1),
+                    description=spec.get("description", "")
+                )
+                for i, spec in enumerate(tenant_specs, 1)
+            ]
+            
+            for i, future in enumerate(futures, 1):
+                success, tenant_config = future.result()
+                results.append((success, tenant_config))
+                
+                if success:
+                    logger.info(f"[PROGRESS] Tenant {i}/{len(tenant_specs)} ({tenant_config.tenant_name}) added successfully")
+                else:
+                    logger.error(f"Failed to add tenant {i}/{len(tenant_specs)}")
         
         successful = sum(1 for success, _ in results if success)
         logger.info(f"\n[SUMMARY] Added {successful}/{len(tenant_specs)} tenants successfully")
@@ -347,9 +416,9 @@ class TenantAdditionManager:
 class DatabaseServerManager:
     """Manages database server addition and cluster scaling."""
     
-    def __init__(self):
+    def __init__(self, client: Optional[ArangoClient] = None):
         creds = CredentialsManager.get_database_credentials()
-        self.client = ArangoClient(hosts=creds.endpoint)
+        self.client = client or create_arango_client(creds.endpoint)
         self.database = None
         self.creds = creds
     
@@ -374,8 +443,8 @@ class DatabaseServerManager:
             logger.error(f"Failed to connect to cluster: {str(e)}")
             return False
     
-    def get_cluster_info(self) -> Dict[str, Any]:
-        """Get current cluster information."""
+    def get_cluster_info(self, use_cache: bool = True) -> Dict[str, Any]:
+        """Get current cluster information, reusing a recent collection snapshot when use_cache is set."""
         try:
             # Note: In ArangoDB Oasis, detailed cluster management is typically
             # handled through the Oasis web interface. This provides basic info.
@@ -388,17 +457,15 @@ class DatabaseServerManager:
                 "server_info": {}
             }
             
-            # Get collection information
-            collections = self.database.collections()
-            for collection in collections:
-                if not collection['name'].startswith('_'):  # Skip system collections
-                    coll = self.database.collection(collection['name'])
-                    count = coll.count()
-                    cluster_info["collections"][collection['name']] = {
-                        "document_count": count,
-                        "type": collection['type']
-                    }
-                    cluster_info["total_documents"] += count
+            # Get collection information, with all document counts in one query
+            snapshot = get_cluster_snapshot(self.database, use_cache)
+            for collection in snapshot.collections:
+                count = snapshot.document_counts[collection['name']]
+                cluster_info["collections"][collection['name']] = {
+                    "document_count": count,
+                    "type": collection['type']
+                }
+                cluster_info["total_documents"] += count
             
             # Get basic server information
             version_info = self.sys_db.version()
@@ -463,9 +530,9 @@ class DatabaseServerManager:
 class ShardRebalancingManager:
     """Manages shard rebalancing across database servers."""
     
-    def __init__(self):
+    def __init__(self, client: Optional[ArangoClient] = None):
         creds = CredentialsManager.get_database_credentials()
-        self.client = ArangoClient(hosts=creds.endpoint)
+        self.client = client or create_arango_client(creds.endpoint)
         self.database = None
         self.creds = creds
     
@@ -481,12 +548,14 @@ class ShardRebalancingManager:
             logger.error(f"Failed to connect: {str(e)}")
             return False
     
-    def get_shard_distribution(self) -> Dict[str, Any]:
-        """Get current shard distribution information."""
+    def get_shard_distribution(self, use_cache: bool = True) -> Dict[str, Any]:
+        """Get current shard distribution information, reusing a recent collection snapshot when use_cache is set."""
         try:
             logger.info(f"[ANALYZE] Analyzing current shard distribution...")
             
-            collections = self.database.collections()
+            snapshot = get_cluster_snapshot(self.database, use_cache)
+            collections = snapshot.collections
+            counts = snapshot.document_counts
             shard_info = {
                 "timestamp": datetime.datetime.now().isoformat(),
                 "database": self.creds.database_name,
@@ -495,20 +564,19 @@ class ShardRebalancingManager:
             }
             
             for collection in collections:
-                if not collection['name'].startswith('_'):  # Skip system collections
-                    coll = self.database.collection(collection['name'])
-                    
-                    # Get collection properties (includes shard information in cluster)
-                    properties = coll.properties()
-                    
-                    shard_info["collections"][collection['name']] = {
-                        "type": collection['type'],
-                        "document_count": coll.count(),
-                        "shard_count": properties.get('numberOfShards', 1),
-                        "replication_factor": properties.get('replicationFactor', 1)
-                    }
-                    
-                    shard_info["total_shards"] += properties.get('numberOfShards', 1)
+                coll = self.database.collection(collection['name'])
+                
+                # Get collection properties (includes shard information in cluster)
+                properties = coll.properties()
+                
+                shard_info["collections"][collection['name']] = {
+                    "type": collection['type'],
+                    "document_count": counts[collection['name']],
+                    "shard_count": properties.get('numberOfShards', 1),
+                    "replication_factor": properties.get('replicationFactor', 1)
+                }
+                
+                shard_info["total_shards"] += properties.get('numberOfShards', 1)
             
             logger.info(f"   [DONE] Analyzed {len(shard_info['collections'])} collections")
             logger.info(f"   Total shards: {shard_info['total_shards']}")
@@ -661,7 +729,7 @@ def main():
         if success:
             logger.info(f"\n[SUCCESS] Tenant addition completed successfully!")
             summary = manager.get_tenant_addition_summary()
-            logger.info(f"Summary: {json.dumps(summary, indent=2)}")
+            logger.info(f"Summary: {dumps_json(summary).decode('utf-8')}")
         else:
             logger.error(f"\n[ERROR] Tenant addition failed!")
             sys.exit(1)
@@ -693,12 +761,12 @@ def main():
         
         cluster_info = server_manager.get_cluster_info()
         logger.info(f"\nCluster Information:")
-        logger.info(json.dumps(cluster_info, indent=2))
+        logger.info(dumps_json(cluster_info).decode("utf-8"))
         
         # Get scaling recommendations
         recommendations = server_manager.get_scaling_recommendations(2)
         logger.info(f"\nServer Addition Recommendations:")
-        logger.info(json.dumps(recommendations, indent=2))
+        logger.info(dumps_json(recommendations).decode("utf-8"))
     
     elif args.operation == "shard-info":
         # Get shard information and simulate rebalancing
@@ -709,12 +777,12 @@ def main():
         
         shard_info = shard_manager.get_shard_distribution()
         logger.info(f"\nShard Distribution:")
-        logger.info(json.dumps(shard_info, indent=2))
+        logger.info(dumps_json(shard_info).decode("utf-8"))
         
         # Simulate rebalancing
         rebalancing = shard_manager.simulate_shard_rebalancing()
         logger.info(f"\nShard Rebalancing Simulation:")
-        logger.info(json.dumps(rebalancing, indent=2))
+        logger.info(dumps_json(rebalancing).decode("utf-8"))
 
 
 if __name__ == "__main__":
@@ -9,10 +9,10 @@ Simulates real-world configuration changes that:
 """
 
 import sys
-import json
 import logging
 import datetime
 import random
+from collections import Counter
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 from dataclasses import dataclass
@@ -26,6 +26,7 @@ from src.ttl.ttl_config import TTLManager, create_ttl_configuration
 from src.ttl.ttl_constants import TTLConstants, TTLMessages, TTLUtilities, NEVER_EXPIRES, DEFAULT_TTL_DAYS
 from src.data_generation.data_generation_utils import KeyGenerator, RandomDataGenerator
 from src.data_generation.data_generation_config import NetworkConfig, DataGenerationLimits
+from src.utils.json_io import write_json_file
 
 logger = logging.getLogger(__name__)
 
@@ -75,12 +76,12 @@ class TransactionSimulator(DatabaseMixin):
             # Query for current configurations (expired = NEVER_EXPIRES)
             aql = f"""
             FOR doc IN {collection_name}
-                FILTER doc.expired == {NEVER_EXPIRES}
-                LIMIT {limit}
+                FILTER doc.expired == @never_expires
+                LIMIT @limit
                 RETURN doc
             """
             
-            results = self.execute_aql(aql)
+            results = self.execute_aql(aql, {"never_expires": NEVER_EXPIRES, "limit": limit})
             
             if self.show_queries:
                 logger.info(f"[QUERY] Find Current {entity_type.title()} Configurations")
@@ -359,11 +360,11 @@ class TransactionSimulator(DatabaseMixin):
             # Find existing version edges that reference the old configuration
             aql_find_old_edges = f"""
             FOR edge IN {version_collection_name}
-                FILTER edge._to == "{change.old_config['_id']}" OR edge._from == "{change.old_config['_id']}"
+                FILTER edge._to == @config_id OR edge._from == @config_id
                 RETURN edge
             """
             
-            cursor = self.database.aql.execute(aql_find_old_edges)
+            cursor = self.database.aql.execute(aql_find_old_edges, bind_vars={"config_id": change.old_config['_id']})
             existing_edges = list(cursor)
             
             # Update existing edges to historical
@@ -639,14 +640,16 @@ class TransactionSimulator(DatabaseMixin):
     
     def get_simulation_summary(self) -> Dict[str, Any]:
         """Get summary of all simulated changes."""
+        entity_counts = Counter(change.entity_type for change in self.simulated_changes)
+        change_type_counts = Counter(change.change_type for change in self.simulated_changes)
         return {
             "total_simulated_changes": len(self.simulated_changes),
-            "device_changes": len([c for c in self.simulated_changes if c.entity_type == "device"]),
-            "software_changes": len([c for c in self.simulated_changes if c.entity_type == "software"]),
+            "device_changes": entity_counts["device"],
+            "software_changes": entity_counts["software"],
             "change_types": {
-                "update": len([c for c in self.simulated_changes if c.change_type == "update"]),
-                "patch": len([c for c in self.simulated_changes if c.change_type == "patch"]),
-                "major_update": len([c for c in self.simulated_changes if c.change_type == "major_update"])
+                "update": change_type_counts["update"],
+                "patch": change_type_counts["patch"],
+                "major_update": change_type_counts["major_update"]
             },
             "ttl_status": self.ttl_manager.get_ttl_status_summary()
         }
@@ -680,8 +683,7 @@ def main():
     results_path = Path("reports") / f"transaction_simulation_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
     results_path.parent.mkdir(exist_ok=True)
 
-    with open(results_path, "w") as f:
-        json.dump(results, f, indent=2)
+    write_json_file(results_path, results)
 
     logger.info(f"\n[RESULTS] Simulation results saved to: {results_path}")
 
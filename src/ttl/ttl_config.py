@@ -5,7 +5,7 @@ Implements selective TTL indexes that only affect historical documents
 while preserving current configurations permanently.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional
 from enum import Enum
 
@@ -61,18 +61,10 @@ class TTLConfiguration:
     preserve_current_configs: bool = True
     
     # Collection-specific configurations
-    vertex_collections: List[str] = None
-    edge_collections: List[str] = None
-    
-    def __post_init__(self):
-        """Initialize default collections if not provided."""
-        # NOTE: No defaults provided - must be explicitly set by calling functions
-        # This prevents hardcoded collection names and ensures proper configuration
-        if self.vertex_collections is None:
-            self.vertex_collections = []
-        
-        if self.edge_collections is None:
-            self.edge_collections = []
+    # NOTE: No defaults provided - must be explicitly set by calling functions
+    # This prevents hardcoded collection names and ensures proper configuration
+    vertex_collections: List[str] = field(default_factory=list)
+    edge_collections: List[str] = field(default_factory=list)
     
     def get_ttl_index_configs(self) -> List[TTLIndexConfiguration]:
         """Generate TTL index configurations for all collections."""
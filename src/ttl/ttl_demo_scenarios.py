@@ -11,19 +11,18 @@ real-world scenarios that showcase:
 
 import logging
 import sys
-import json
 import datetime
 import time
 from typing import Dict, List, Any, Optional
 from pathlib import Path
-from arango import ArangoClient
 
 # Import project modules
 from src.config.centralized_credentials import CredentialsManager
 from src.config.config_management import get_config, NamingConvention
 from src.simulation.transaction_simulator import TransactionSimulator
-from src.database.database_utilities import QueryExecutor
+from src.database.database_utilities import QueryExecutor, create_arango_client
 from src.ttl.ttl_constants import TTLConstants, TTLMessages, TTLUtilities, NEVER_EXPIRES, DEFAULT_TTL_DAYS
+from src.utils.json_io import write_json_file
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +30,17 @@ logger = logging.getLogger(__name__)
 class TTLDemoScenarios:
     """Demonstrates TTL time travel capabilities with realistic scenarios."""
     
+    # Latest version of a configuration that was active at a point in time;
+    # values are bound so every lookup reuses one query text
+    _POINT_IN_TIME_AQL = """
+    FOR doc IN @@collection
+        FILTER STARTS_WITH(doc._key, @base_key) OR doc._key == @key
+        FILTER doc.created <= @point_in_time AND doc.expired > @point_in_time
+        SORT doc.created DESC
+        LIMIT 1
+        RETURN doc
+    """
+    
     def __init__(self, naming_convention: NamingConvention = NamingConvention.CAMEL_CASE, show_queries: bool = False):
         self.naming_convention = naming_convention
         self.app_config = get_config("production", naming_convention)
@@ -38,7 +48,7 @@ class TTLDemoScenarios:
         
         # Database connection
         creds = CredentialsManager.get_database_credentials()
-        self.client = ArangoClient(hosts=creds.endpoint)
+        self.client = create_arango_client(creds.endpoint)
         self.database = None
         self.creds = creds
         
@@ -371,18 +381,13 @@ class TTLDemoScenarios:
             # Extract base key (remove any suffixes)
             base_key = device_key.split("_sim_")[0] if "_sim_" in device_key else device_key
             
-            aql = f"""
-            FOR doc IN {collection_name}
-                FILTER doc._key LIKE "{base_key}%" OR doc._key == "{device_key}"
-                FILTER doc.created <= {timestamp.timestamp()} AND doc.expired > {timestamp.timestamp()}
-                SORT doc.created DESC
-                LIMIT 1
-                RETURN doc
-            """
-            
-            cursor = self.database.aql.execute(aql)
-            results = list(cursor)
-            return results[0] if results else None
+            cursor = self.database.aql.execute(self._POINT_IN_TIME_AQL, bind_vars={
+                "@collection": collection_name,
+                "base_key": base_key,
+                "key": device_key,
+                "point_in_time": timestamp.timestamp()
+            })
+            return next(cursor, None)
             
         except Exception as e:
             logger.error(f"[ERROR] Failed to query device at time: {str(e)}")
@@ -398,18 +403,13 @@ class TTLDemoScenarios:
             # Extract base key
             base_key = software_key.split("_sim_")[0] if "_sim_" in software_key else software_key
             
-            aql = f"""
-            FOR doc IN {collection_name}
-                FILTER doc._key LIKE "{base_key}%" OR doc._key == "{software_key}"
-                FILTER doc.created <= {timestamp.timestamp()} AND doc.expired > {timestamp.timestamp()}
-                SORT doc.created DESC
-                LIMIT 1
-                RETURN doc
-            """
-            
-            cursor = self.database.aql.execute(aql)
-            results = list(cursor)
-            return results[0] if results else None
+            cursor = self.database.aql.execute(self._POINT_IN_TIME_AQL, bind_vars={
+                "@collection": collection_name,
+                "base_key": base_key,
+                "key": software_key,
+                "point_in_time": timestamp.timestamp()
+            })
+            return next(cursor, None)
             
         except Exception as e:
             logger.error(f"[ERROR] Failed to query software at time: {str(e)}")
@@ -501,8 +501,7 @@ def main():
     results_path = Path("reports") / f"ttl_demo_results_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
     results_path.parent.mkdir(exist_ok=True)
     
-    with open(results_path, "w") as f:
-        json.dump(results, f, indent=2)
+    write_json_file(results_path, results)
     
     logger.info(f"\n[RESULTS] Demo results saved to: {results_path}")
 
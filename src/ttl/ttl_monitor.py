@@ -11,7 +11,7 @@ import time
 import datetime
 import sys
 from typing import Dict, List, Any
-from arango import ArangoClient
+from src.database.database_utilities import create_arango_client
 
 from src.config.centralized_credentials import CredentialsManager
 from src.ttl.ttl_config import create_demo_ttl_configuration
@@ -37,7 +37,7 @@ class TTLMonitor:
         """Connect to the ArangoDB database."""
         try:
             creds = CredentialsManager.get_database_credentials()
-            client = ArangoClient(hosts=creds.endpoint)
+            client = create_arango_client(creds.endpoint)
             self.database = client.db(creds.database_name, **CredentialsManager.get_database_params())
             return True
         except Exception as e:
@@ -56,32 +56,28 @@ class TTLMonitor:
                     
                 collection = self.database.collection(collection_name)
                 
-                # Current documents (no ttlExpireAt field)
-                current_query = f"""
+                # Count current documents (no ttlExpireAt field) and historical
+                # documents by TTL status server-side; only the counts are transferred
+                count_query = f"""
                 FOR doc IN {collection_name}
-                  FILTER !HAS(doc, 'ttlExpireAt')
-                  RETURN 1
+                  COLLECT
+                    historical = HAS(doc, 'ttlExpireAt'),
+                    pending = HAS(doc, 'ttlExpireAt') AND doc.ttlExpireAt > @now
+                  WITH COUNT INTO documentCount
+                  RETURN {{historical, pending, documentCount}}
                 """
-                current_count = len(list(self.database.aql.execute(current_query)))
-                
-                # Historical documents with TTL
-                historical_query = f"""
-                FOR doc IN {collection_name}
-                  FILTER HAS(doc, 'ttlExpireAt')
-                  RETURN doc.ttlExpireAt
-                """
-                historical_docs = list(self.database.aql.execute(historical_query))
-                
-                # Count documents by TTL status
-                now = time.time()
-                pending_expiry = len([ts for ts in historical_docs if ts > now])
-                already_expired = len([ts for ts in historical_docs if ts <= now])
+                status_counts = {
+                    (row["historical"], row["pending"]): row["documentCount"]
+                    for row in self.database.aql.execute(count_query, bind_vars={"now": time.time()})
+                }
+                pending_expiry = status_counts.get((True, True), 0)
+                already_expired = status_counts.get((True, False), 0)
                 
                 counts[collection_name] = {
-                    "current": current_count,
+                    "current": status_counts.get((False, False), 0),
                     "historical_pending": pending_expiry,
                     "historical_expired": already_expired,
-                    "total_historical": len(historical_docs)
+                    "total_historical": pending_expiry + already_expired
                 }
                 
             except Exception as e:
@@ -110,9 +106,8 @@ class TTLMonitor:
                   RETURN doc.ttlExpireAt
                 """
                 
-                results = list(self.database.aql.execute(query, bind_vars={"now": time.time()}))
-                if results:
-                    expiry_time = results[0]
+                expiry_time = next(self.database.aql.execute(query, bind_vars={"now": time.time()}), None)
+                if expiry_time is not None:
                     if next_expiry is None or expiry_time < next_expiry:
                         next_expiry = expiry_time
                         next_collection = collection_name
@@ -132,42 +127,45 @@ class TTLMonitor:
     
     def display_ttl_status(self):
         """Display current TTL status with live updates."""
-        print("\n" + "=" * 60)
-        print("TTL AGING MONITOR")
-        print("=" * 60)
+        # Query first, then render the whole screen with one write so a live
+        # refresh never shows a half-drawn status while queries are running
+        counts = self.get_document_counts()
+        next_expiry = self.get_next_expiry_time()
+        
+        lines = ["\n" + "=" * 60, "TTL AGING MONITOR", "=" * 60]
         
         # Document counts
-        counts = self.get_document_counts()
-        print(f"\nDocument Counts:")
+        lines.append(f"\nDocument Counts:")
         for collection, count_info in counts.items():
             current = count_info["current"]
             historical = count_info["total_historical"]
             pending = count_info["historical_pending"] 
             expired = count_info["historical_expired"]
             
-            print(f"  {collection}:")
-            print(f"    Current (permanent): {current}")
-            print(f"    Historical (TTL): {historical} total ({pending} pending, {expired} expired)")
+            lines.append(f"  {collection}:")
+            lines.append(f"    Current (permanent): {current}")
+            lines.append(f"    Historical (TTL): {historical} total ({pending} pending, {expired} expired)")
         
         # Next expiry
-        next_expiry = self.get_next_expiry_time()
         if next_expiry:
             remaining = next_expiry["seconds_remaining"]
             if remaining > 0:
                 minutes = int(remaining // 60)
                 seconds = int(remaining % 60)
-                print(f"\nNext TTL Expiry:")
-                print(f"  Collection: {next_expiry['collection']}")
-                print(f"  Time: {next_expiry['datetime'].strftime('%H:%M:%S')}")
-                print(f"  Countdown: {minutes}m {seconds}s")
+                lines.append(f"\nNext TTL Expiry:")
+                lines.append(f"  Collection: {next_expiry['collection']}")
+                lines.append(f"  Time: {next_expiry['datetime'].strftime('%H:%M:%S')}")
+                lines.append(f"  Countdown: {minutes}m {seconds}s")
             else:
-                print(f"\nNext TTL Expiry: Documents ready for cleanup")
+                lines.append(f"\nNext TTL Expiry: Documents ready for cleanup")
         else:
-            print(f"\nNext TTL Expiry: No historical documents found")
+            lines.append(f"\nNext TTL Expiry: No historical documents found")
+        
+        lines.append(f"\nTTL Configuration:")
+        lines.append(f"  TTL Interval: {TTLConstants.DEMO_TTL_EXPIRE_MINUTES} minutes")
+        lines.append(f"  Current Time: {datetime.datetime.now().strftime('%H:%M:%S')}")
         
-        print(f"\nTTL Configuration:")
-        print(f"  TTL Interval: {TTLConstants.DEMO_TTL_EXPIRE_MINUTES} minutes")
-        print(f"  Current Time: {datetime.datetime.now().strftime('%H:%M:%S')}")
+        print("\n".join(lines))
     
     def monitor_live(self, duration_minutes: int = 15, refresh_seconds: int = 30):
         """Monitor TTL aging live for the specified duration."""
@@ -0,0 +1,158 @@
+"""
+JSON I/O Utilities
+
+Centralized JSON serialization for generated data files, reports and registries.
+Uses orjson when it is installed (optional ``performance`` extra) and falls back
+to the standard library otherwise; both paths produce equivalent 2-space indented
+UTF-8 output. Large JSON arrays can be read incrementally with ijson (same extra).
+"""
+
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def dumps_json(data: Any, indent: bool = True) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON bytes.
+
+    Args:
+        data: JSON-serializable data
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def serialize_json(data: Any) -> str:
+    """
+    Compact JSON serializer for ArangoClient request bodies.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        Compact JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data, separators=(",", ":"))
+
+
+def deserialize_json(data: str) -> Any:
+    """
+    JSON deserializer for ArangoClient response bodies.
+
+    Args:
+        data: JSON string
+
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json_file(file_path: Union[str, Path], data: Any, indent: bool = True) -> None:
+    """
+    Write data to a JSON file.
+
+    Args:
+        file_path: Path to output file
+        data: JSON-serializable data
+        indent: Pretty-print with 2-space indentation
+    """
+    with open(file_path, "wb") as f:
+        f.write(dumps_json(data, indent))
+
+
+def write_json_array(file_path: Union[str, Path], documents: Iterable[Dict[str, Any]],
+                     buffer_size: int = 1 << 20) -> int:
+    """
+    Stream documents to a file as a JSON array, one compact document per line.
+
+    Each document is encoded and written as it is consumed, so the encoded
+    form of the whole collection is never held in memory at once. The result
+    is a regular JSON array that any JSON reader can load.
+
+    Args:
+        file_path: Path to output file
+        documents: Iterable of JSON-serializable documents
+        buffer_size: Write buffer size in bytes
+
+    Returns:
+        Number of documents written
+    """
+    count = 0
+    with open(file_path, "wb", buffering=buffer_size) as f:
+        write = f.write
+        write(b"[")
+        for document in documents:
+            write(b",\n" if count else b"\n")
+            write(dumps_json(document, indent=False))
+            count += 1
+        write(b"\n]" if count else b"]")
+    return count
+
+
+def read_json_file(file_path: Union[str, Path]) -> Any:
+    """
+    Read and parse a JSON file.
+
+    With orjson installed the file is memory-mapped and parsed in place,
+    avoiding a copy of the whole file into a bytes object first.
+
+    Args:
+        file_path: Path to input file
+
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is not None:
+        with open(file_path, "rb") as f:
+            # Zero-length files cannot be mapped; let the parser report them
+            if not os.fstat(f.fileno()).st_size:
+                return orjson.loads(b"")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+    return json.loads(Path(file_path).read_bytes())
+
+
+def iter_json_array(file_path: Union[str, Path]) -> Iterator[Any]:
+    """
+    Yield the elements of a top-level JSON array one at a time.
+    
+    With ijson installed the file is parsed incrementally, so only the
+    current element is held in memory. Without it the whole file is parsed
+    first and its elements are yielded from the resulting list.
+    
+    Args:
+        file_path: Path to a file containing a JSON array
+        
+    Returns:
+        Iterator over the array elements
+    """
+    if ijson is None:
+        yield from read_json_file(file_path)
+        return
+    with open(file_path, "rb") as f:
+        yield from ijson.items(f, "item", use_float=True)
+
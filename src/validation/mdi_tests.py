@@ -23,6 +23,7 @@ from pathlib import Path
 # Import our utilities
 from src.config.centralized_credentials import CredentialsManager
 from src.database.database_utilities import DatabaseConnectionManager, QueryExecutor
+from src.utils.json_io import write_json_file
 
 logger = logging.getLogger(__name__)
 
@@ -124,12 +125,12 @@ class MDIIndexTester:
           }
         """
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         results1 = QueryExecutor.execute_and_display_query(
             self.database, query1, "Point-in-Time Query (Active)", 
             {"point_in_time": current_time}, self.show_queries
         )
-        query1_time = time.time() - start_time
+        query1_time = time.perf_counter() - start_time
         test_results["point_in_time"] = {
             "query_time": query1_time,
             "result_count": len(results1),
@@ -151,12 +152,12 @@ class MDIIndexTester:
           }
         """
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         results2 = QueryExecutor.execute_and_display_query(
             self.database, query2, "Range Query (Creation Window)", 
             {"start_time": past_time, "end_time": current_time}, self.show_queries
         )
-        query2_time = time.time() - start_time
+        query2_time = time.perf_counter() - start_time
         test_results["creation_range"] = {
             "query_time": query2_time,
             "result_count": len(results2),
@@ -179,12 +180,12 @@ class MDIIndexTester:
           }
         """
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         results3 = QueryExecutor.execute_and_display_query(
             self.database, query3, "Complex Temporal Overlap", 
             {"start_time": past_time, "end_time": current_time}, self.show_queries
         )
-        query3_time = time.time() - start_time
+        query3_time = time.perf_counter() - start_time
         test_results["temporal_overlap"] = {
             "query_time": query3_time,
             "result_count": len(results3),
@@ -207,12 +208,12 @@ class MDIIndexTester:
           }
         """
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         results4 = QueryExecutor.execute_and_display_query(
             self.database, query4, "Software Point-in-Time Query", 
             {"point_in_time": current_time}, self.show_queries
         )
-        query4_time = time.time() - start_time
+        query4_time = time.perf_counter() - start_time
         test_results["software_point_in_time"] = {
             "query_time": query4_time,
             "result_count": len(results4),
@@ -235,12 +236,12 @@ class MDIIndexTester:
           }
         """
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         results5 = QueryExecutor.execute_and_display_query(
             self.database, query5, "Version Edge Temporal Query", 
             {"point_in_time": current_time}, self.show_queries
         )
-        query5_time = time.time() - start_time
+        query5_time = time.perf_counter() - start_time
         test_results["version_edges"] = {
             "query_time": query5_time,
             "result_count": len(results5),
@@ -337,9 +338,9 @@ class MDIIndexTester:
         
         logger.info(f"   [PERF] Running {iterations} iterations of temporal query...")
         for i in range(iterations):
-            start_time = time.time()
+            start_time = time.perf_counter()
             results = list(self.database.aql.execute(temporal_query, bind_vars={"point_in_time": current_time}))
-            iteration_time = time.time() - start_time
+            iteration_time = time.perf_counter() - start_time
             total_time += iteration_time
             
             if self.show_queries and i == 0:
@@ -433,10 +434,8 @@ def main():
     
     # Save results if requested
     if args.save_results:
-        import json
         output_file = Path(args.save_results)
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        write_json_file(output_file, results)
         logger.info(f"\n[SAVED] Test results saved to: {output_file}")
     
     # Exit with appropriate code
@@ -7,6 +7,7 @@ code quality and functionality across all components.
 
 import os
 import unittest
+import unittest.mock
 import json
 import tempfile
 import uuid
@@ -48,6 +49,26 @@ class TestConfigurationManagement(unittest.TestCase):
         self.assertTrue(len(creds.password) > 0)
         self.assertTrue(len(creds.database_name) > 0)
     
+    def test_database_credentials_cached_until_reload(self):
+        """Test credentials are resolved once per environment and refreshed by reload."""
+        env = {
+            'ARANGO_ENDPOINT': 'https://example.arangodb.cloud:8529',
+            'ARANGO_USERNAME': 'root',
+            'ARANGO_PASSWORD': 'secret',
+            'ARANGO_DATABASE': 'network_assets_demo'
+        }
+        CredentialsManager.reload()
+        try:
+            with unittest.mock.patch.dict(os.environ, env):
+                first = CredentialsManager.get_database_credentials()
+                os.environ['ARANGO_DATABASE'] = 'other_database'
+                self.assertIs(CredentialsManager.get_database_credentials(), first)
+                
+                CredentialsManager.reload()
+                self.assertEqual(CredentialsManager.get_database_credentials().database_name, 'other_database')
+        finally:
+            CredentialsManager.reload()
+    
     def test_application_paths_initialization(self):
         """Test application paths setup."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -183,7 +204,7 @@ class TestDataGeneration(unittest.TestCase):
         
         # Test device type selection
         device_type = gen.select_device_type()
-        self.assertIsInstance(device_type, DeviceType)
+        self.assertIn(device_type, DeviceType.ALL)
         
         # Test IP address generation
         ip = gen.generate_ip_address()
@@ -193,6 +214,63 @@ class TestDataGeneration(unittest.TestCase):
         mac = gen.generate_mac_address()
         self.assertRegex(mac, r'^([0-9a-f]{2}:){5}[0-9a-f]{2}$')
     
+    def test_random_data_generator_distinct_pairs(self):
+        """Test pair sampling never yields self loops or duplicates."""
+        gen = RandomDataGenerator()
+        
+        pairs = gen.select_distinct_pairs(5, 20)
+        self.assertEqual(len(pairs), 20)  # 5 * 4 possible pairs
+        self.assertEqual(len(set(pairs)), 20)
+        for from_index, to_index in pairs:
+            self.assertNotEqual(from_index, to_index)
+            self.assertTrue(0 <= from_index < 5 and 0 <= to_index < 5)
+        
+        self.assertEqual(len(gen.select_distinct_pairs(5, 100)), 20)
+        self.assertEqual(gen.select_distinct_pairs(1, 10), [])
+    
+    def test_device_configuration_change_preserves_shared_rules(self):
+        """Test configuration changes never mutate the previous configuration's rules."""
+        from src.data_generation.data_generation_config import NetworkConfig
+        from src.data_generation.data_generation_utils import DeviceConfigurationManager
+        
+        from src.config.generation_constants import GENERATION_CONSTANTS
+        
+        default_rules = tuple(GENERATION_CONSTANTS.DEFAULT_FIREWALL_RULES)
+        network_config = NetworkConfig()
+        manager = DeviceConfigurationManager(RandomDataGenerator(network_config))
+        config = {"_key": "t1:device1-0", "firewallRules": network_config.DEFAULT_FIREWALL_RULES}
+        
+        # Force the "add firewall rule" branch for both changes
+        with unittest.mock.patch("random.random", return_value=0.1):
+            first = manager.apply_device_configuration_change(config)
+            second = manager.apply_device_configuration_change(config)
+        
+        self.assertIsInstance(first["firewallRules"], list)
+        self.assertIsInstance(second["firewallRules"], list)
+        self.assertIsNot(first["firewallRules"], second["firewallRules"])
+        
+        second_rules = list(second["firewallRules"])
+        first["firewallRules"].append("allow 22")
+        self.assertEqual(second["firewallRules"], second_rules)
+        
+        self.assertEqual(config["firewallRules"], default_rules)
+        self.assertEqual(GENERATION_CONSTANTS.DEFAULT_FIREWALL_RULES, default_rules)
+    
+    def test_configuration_changes_use_owl_property_names(self):
+        """Test configuration changes emit W3C OWL property names directly."""
+        from src.data_generation.data_generation_utils import DeviceConfigurationManager
+        
+        manager = DeviceConfigurationManager(RandomDataGenerator())
+        device = {"_key": "t1:device1-0", "hostName": "t1_device1", "firewallRules": ("allow 80",)}
+        software = {"_key": "t1:software1-0", "portNumber": 8080, "isEnabled": True}
+        
+        for _ in range(20):
+            device = manager.apply_device_configuration_change(device)
+            software = manager.apply_software_configuration_change(software)
+            self.assertEqual(set(device), {"_key", "hostName", "firewallRules"})
+            self.assertEqual(set(software), {"_key", "portNumber", "isEnabled"})
+            self.assertTrue(device["hostName"].startswith("t1_"))
+    
     def test_document_enhancer_temporal_attributes(self):
         """Test document enhancer temporal attributes."""
         document = {"_key": "test_key", "name": "test_device"}
@@ -347,6 +425,83 @@ class TestFileManagement(unittest.TestCase):
             loaded_data = json.load(f)
         
         self.assertEqual(loaded_data, test_data)
+    
+    def test_json_io_round_trip(self):
+        """Test JSON helper output is readable by the standard library."""
+        from src.utils.json_io import write_json_file, read_json_file
+        
+        test_file = Path(self.temp_dir) / "round_trip.json"
+        test_data = [{"_key": "t1:device1-0", "created": 1.5, "expired": 9223372036854775807, "name": "Zürich"}]
+        
+        write_json_file(test_file, test_data)
+        
+        with open(test_file, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f), test_data)
+        self.assertEqual(read_json_file(test_file), test_data)
+    
+    def test_json_array_streaming(self):
+        """Test streamed collection files load as regular JSON arrays."""
+        from src.utils.json_io import write_json_array
+        
+        test_file = Path(self.temp_dir) / "collection.json"
+        documents = [{"_key": f"device{i}", "index": i} for i in range(5)]
+        
+        self.assertEqual(write_json_array(test_file, iter(documents)), 5)
+        with open(test_file, 'r') as f:
+            self.assertEqual(json.load(f), documents)
+        
+        self.assertEqual(write_json_array(test_file, []), 0)
+        with open(test_file, 'r') as f:
+            self.assertEqual(json.load(f), [])
+
+    def test_bulk_import_batching(self):
+        """Test bulk imports are split into byte-bounded batches."""
+        from src.database.database_utilities import BulkImporter
+
+        # 1000 documents of ~100 bytes each, 1000-byte requests -> 10 per batch
+        self.assertEqual(BulkImporter.docs_per_batch(1000, 100_000, 1000), 10)
+        self.assertEqual(BulkImporter.docs_per_batch(10, 10_000_000, 1000), 1)
+
+        documents = [{"_key": str(i)} for i in range(25)]
+        batches = list(BulkImporter.batches(documents, 10))
+        self.assertEqual([len(batch) for batch in batches], [10, 10, 5])
+        self.assertEqual([doc for batch in batches for doc in batch], documents)
+
+    def test_bulk_import_file_batches(self):
+        """Test data files batch identically whether parsed whole or streamed."""
+        from src.database.database_utilities import BulkImporter
+        from src.utils.json_io import write_json_array
+
+        test_file = Path(self.temp_dir) / "collection.json"
+        documents = [{"_key": f"device{i}", "weight": i / 2} for i in range(40)]
+        write_json_array(test_file, documents)
+
+        for stream_threshold in (1 << 30, 0):
+            batches = list(BulkImporter.file_batches(test_file, 200, stream_threshold))
+            self.assertGreater(len(batches), 1)
+            self.assertEqual([doc for batch in batches for doc in batch], documents)
+
+        write_json_array(test_file, [])
+        self.assertEqual(list(BulkImporter.file_batches(test_file, 200, 0)), [])
+
+    def test_tenant_data_files_written_concurrently(self):
+        """Test concurrent tenant file writes produce every mapped collection file."""
+        app_config = unittest.mock.Mock()
+        app_config.get_file_name.side_effect = lambda collection_type: f"{collection_type}.json"
+        data_collections = {
+            "devices": [{"_key": "device1"}],
+            "types": [{"_key": "type1"}, {"_key": "type2"}],
+            "unmapped": [{"_key": "ignored"}]
+        }
+
+        with unittest.mock.patch.object(FileManager, "ensure_tenant_directory",
+                                        return_value=Path(self.temp_dir)):
+            FileManager.write_tenant_data_files(self.tenant_config, data_collections, app_config)
+
+        self.assertEqual(sorted(p.name for p in Path(self.temp_dir).iterdir()),
+                         ["devices.json", "types.json"])
+        with open(Path(self.temp_dir) / "types.json", 'r') as f:
+            self.assertEqual(json.load(f), data_collections["types"])
 
 
 class TestIntegration(unittest.TestCase):